@@ -147,6 +147,8 @@ def annotate_whatnot_pdf_with_bins_and_firstname(
     conn.close()
 
     mailing_list = MailingListManager()
+    # Buyers are saved together in one transaction after the PDF pass
+    pending_entries = []
 
     pdf_reader = PdfReader(whatnot_pdf_path)
     pdf_writer = PdfWriter()
@@ -180,7 +182,7 @@ def annotate_whatnot_pdf_with_bins_and_firstname(
                     }
                     print(f"[DEBUG] Final mailing entry: {mailing_entry}")
                     if current_buyer not in saved_usernames:
-                        mailing_list.add_or_update_entry(mailing_entry)
+                        pending_entries.append(mailing_entry)
                         saved_usernames.add(current_buyer)
                     current_spent_total = 0.0
 
@@ -265,7 +267,9 @@ def annotate_whatnot_pdf_with_bins_and_firstname(
                 "order_id": f"PG{len(pdf_reader.pages):03}"
             }
             print(f"[DEBUG] Final mailing entry (EOF): {mailing_entry}")
-            mailing_list.add_or_update_entry(mailing_entry)
+            pending_entries.append(mailing_entry)
+
+    mailing_list.add_or_update_entries(pending_entries)
 
     # Summary page for duplicate bins
     duplicates = {u: c for u, c in label_counts.items() if c > 1}
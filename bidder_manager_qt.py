@@ -10,6 +10,15 @@ from config_qt import DEFAULT_DATA_DIR
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Applied to every connection BidderManager opens.  journal_mode=WAL is
+# persistent, so this only converts databases not created by main_qt (e.g.
+# copied bundles); the rest are per-connection settings.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; "
+    "PRAGMA cache_size=-65536; PRAGMA mmap_size=268435456; PRAGMA busy_timeout=5000; "
+    "PRAGMA foreign_keys=ON;"
+)
+
 class BidderManager:
     """
     Manages bidder transactions, bin assignments, and install data for SwiftSale,
@@ -42,7 +51,7 @@ class BidderManager:
                 logger.info("No bundled bidders.db found; will create fresh schema on connect.")
 
         try:
-            self.conn = sqlite3.connect(self.bidders_db_path, check_same_thread=False)
+            self.conn = self._connect(self.bidders_db_path)
             logger.info("Connected to bidders.db successfully")
             self._verify_schema(self.conn, "bidders.db")
         except sqlite3.Error as e:
@@ -69,8 +78,7 @@ class BidderManager:
                 logger.info("No bundled subscriptions.db found; will create fresh schema on connect.")
 
         try:
-            self.sub_conn = sqlite3.connect(self.subs_db_path, check_same_thread=False)
-            self.sub_conn.execute("PRAGMA foreign_keys = ON;")
+            self.sub_conn = self._connect(self.subs_db_path)
             logger.info("Connected to subscriptions.db successfully")
             self._verify_schema(self.sub_conn, "subscriptions.db")
         except sqlite3.Error as e:
@@ -85,6 +93,12 @@ class BidderManager:
         self.show_start_time = None
         self.bidders = {}  # For in-memory transactions
 
+    @staticmethod
+    def _connect(db_path):
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
     def _verify_schema(self, conn, db_name):
         """Verify the database schema version, recreate if outdated."""
         try:
@@ -657,6 +671,28 @@ class BidderManager:
             self.sub_conn.rollback()
             raise
 
+    def apply_tier_change(self, user_email, hashed_email, tier, install_tier, license_key):
+        """
+        Record a subscription tier change and mirror it onto the user's install
+        row in one transaction.  Returns True if an install row was updated.
+        """
+        try:
+            with self.sub_conn:
+                self.sub_conn.execute("""
+                    INSERT INTO subscriptions (email, tier, license_key)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(email) DO UPDATE SET tier = excluded.tier, license_key = excluded.license_key
+                """, (user_email, tier, license_key))
+                cursor = self.sub_conn.execute(
+                    "UPDATE installs SET tier = ? WHERE hashed_email = ?",
+                    (install_tier, hashed_email)
+                )
+            logger.info("Applied tier change for %s: tier=%s, install_tier=%s", user_email, tier, install_tier)
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            logger.error("Failed to apply tier change for %s: %s", user_email, e)
+            raise
+
     def update_user_tier(self, user_email, new_tier):
         """Update the user's tier in the subscriptions table."""
         if not user_email or not new_tier:
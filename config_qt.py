@@ -19,6 +19,7 @@ import sys
 import json
 import logging
 import uuid
+from types import MappingProxyType
 from datetime import datetime  # Used for promo_expiration handling
 from cryptography.fernet import Fernet
 
@@ -43,13 +44,13 @@ NGROK_PATH = os.getenv(
 
 DEFAULT_TRIAL_EMAIL = "trial@swiftsaleapp.com"
 
-# Stripe price mappings
-PRICE_MAP = {
+# Stripe price mappings (read-only; shared by every StripeService)
+PRICE_MAP = MappingProxyType({
     "Bronze": "price_1RLcP4J7WrcpTNl6a8aHdSgv",
     "Silver": "price_1RLcKcJ7WrcpTNl6jT7sLvmU",
     "Gold": "price_1RQefvJ7WrcpTNl68QwN2zEj",
-}
-REVERSE_PRICE_MAP = {v: k for k, v in PRICE_MAP.items()}
+})
+REVERSE_PRICE_MAP = MappingProxyType({v: k for k, v in PRICE_MAP.items()})
 
 # Bin limits per tier
 TIER_LIMITS = {
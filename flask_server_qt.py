@@ -9,7 +9,8 @@ from flask import Flask, render_template, jsonify, request, g
 from flask_socketio import SocketIO
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from waitress import serve
+from waitress import create_server
+import threading
 from config_qt import PRICE_MAP, REVERSE_PRICE_MAP, TIER_LIMITS, load_config, get_resource_path, DEFAULT_DATA_DIR, get_config_value
 from stripe_service_qt import StripeService
 from bidder_manager_qt import BidderManager
@@ -59,9 +60,14 @@ class FlaskServer:
     def __init__(self, port, stripe_service, api_token: str,
                  latest_bin_assignment_callback, secret_key: str,
                  log_info, log_error, user_data_dir=None,
-                 bidder_manager=None, telegram_service=None):
+                 bidder_manager=None, telegram_service=None, sock=None):
         self.env = os.getenv("FLASK_ENV", "development").lower()
-        self.port = int(os.getenv("PORT", port))
+        # A pre-bound socket (from the port probe) is served directly so the
+        # port cannot be taken between probing and listening.
+        self.sock = sock
+        # Set once the server socket is listening; see wait_for_server in main_qt
+        self.ready = threading.Event()
+        self.port = sock.getsockname()[1] if sock is not None else int(os.getenv("PORT", port))
         self.api_token = os.getenv("API_TOKEN", api_token)
         self.secret_key = os.getenv("SECRET_KEY", secret_key)
         user_data_dir = os.getenv("RENDER_DATA_DIR", "/opt/render/project/swiftsale_data" if os.getenv("RENDER") == "true" else
@@ -82,7 +88,10 @@ class FlaskServer:
 
         self.log_info = log_info
         self.log_error = log_error
-        self.stripe_service = stripe_service
+        # Either a StripeService or a zero-argument factory for one; a factory is
+        # only called on first use so WSGI workers don't pay for it at import
+        self._stripe_service = stripe_service
+        self._stripe_service_lock = threading.Lock()
         self.latest_bin_assignment_callback = latest_bin_assignment_callback
         self.bidder_manager = bidder_manager
         self.telegram_service = telegram_service
@@ -274,9 +283,23 @@ class FlaskServer:
         def on_connect():
             self.logger.info("Client connected via SocketIO", extra={"request_id": getattr(g, 'request_id', 'unknown')})
 
+    @property
+    def stripe_service(self):
+        if callable(self._stripe_service):
+            with self._stripe_service_lock:
+                if callable(self._stripe_service):
+                    self._stripe_service = self._stripe_service()
+        return self._stripe_service
+
     def start(self):
         self.logger.info(f"Starting Flask server on port {self.port}")
-        serve(self.app, host="0.0.0.0", port=self.port, threads=8)
+        if self.sock is not None:
+            server = create_server(self.app, sockets=[self.sock], threads=8)
+        else:
+            server = create_server(self.app, host="0.0.0.0", port=self.port, threads=8)
+        # create_server returns with the socket already listening
+        self.ready.set()
+        server.run()
 
     def shutdown(self):
         self.logger.info("Shutting down Flask server")
@@ -15,6 +15,7 @@ logic as needed.
 from cloud_database_qt import CloudDatabaseManager  # use corrected DB manager
 from datetime import datetime, timedelta
 from PySide6.QtWidgets import QMessageBox, QApplication, QInputDialog, QProgressDialog
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 from config_qt import save_install_info
 
 import sqlite3
@@ -352,6 +353,42 @@ def open_dev_code_dialog(self):
         QMessageBox.warning(self, "Access Denied", str(e))
 
 
+class _StripeTaskSignals(QObject):
+    succeeded = Signal(object)
+    failed = Signal(str)
+
+
+class _StripeTask(QRunnable):
+    """Run a blocking Stripe call on a pool thread and report the outcome via signals."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _StripeTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.succeeded.emit(result)
+
+
+def _run_stripe_async(self, fn, on_success, on_error):
+    """Submit ``fn`` to the global thread pool; callbacks run back on the GUI thread."""
+    if not hasattr(self, "_stripe_tasks"):
+        self._stripe_tasks = set()
+    task = _StripeTask(fn)
+    # Keep a reference until the task reports back so its signals stay alive
+    self._stripe_tasks.add(task)
+    task.signals.succeeded.connect(lambda _: self._stripe_tasks.discard(task), Qt.QueuedConnection)
+    task.signals.failed.connect(lambda _: self._stripe_tasks.discard(task), Qt.QueuedConnection)
+    task.signals.succeeded.connect(on_success, Qt.QueuedConnection)
+    task.signals.failed.connect(on_error, Qt.QueuedConnection)
+    QThreadPool.globalInstance().start(task)
+
+
 def on_upgrade(self):
     """Handle clicking the Upgrade button in the Subscription tab with real-time refresh."""
     new_tier = self.tier_combo.currentText()
@@ -368,16 +405,29 @@ def on_upgrade(self):
     if not self.license_key:
         self.log_info("No license key yet — assuming trial user upgrading for first time.")
 
-    try:
-        self.log_info(
-            f"Creating Stripe checkout session for {self.user_email} upgrading to {new_tier}"
-        )
-        response, status = self.stripe_service.create_checkout_session(
+    self.log_info(
+        f"Creating Stripe checkout session for {self.user_email} upgrading to {new_tier}"
+    )
+    _run_stripe_async(
+        self,
+        lambda: self.stripe_service.create_checkout_session(
             tier=new_tier,
             user_email=self.user_email,
             request_url_root="https://swiftsale4.onrender.com/",
-        )
+        ),
+        on_success=lambda result: _finalize_upgrade(self, new_tier, *result),
+        on_error=lambda e: _upgrade_failed(self, e),
+    )
 
+
+def _upgrade_failed(self, error):
+    self.log_error(f"Upgrade error: {error}")
+    QMessageBox.critical(self, "Error", f"Failed to upgrade subscription: {error}")
+
+
+def _finalize_upgrade(self, new_tier, response, status):
+    """Open the checkout page returned by Stripe and start polling for the new tier."""
+    try:
         if status == 200 and response.get("url"):
             checkout_url = response["url"]
             import webbrowser
@@ -415,8 +465,7 @@ def on_upgrade(self):
             QMessageBox.critical(self, "Error", error_msg)
 
     except Exception as e:
-        self.log_error(f"Upgrade error: {e}")
-        QMessageBox.critical(self, "Error", f"Failed to upgrade subscription: {e}")
+        _upgrade_failed(self, e)
 
 
 def _poll_subscription_status(self, expected_tier, max_retries=6, delay=4):
@@ -494,6 +543,7 @@ def bind_event_methods(gui):
     gui.on_username_changed = on_username_changed.__get__(gui, gui.__class__)
     gui.open_dev_code_dialog = open_dev_code_dialog.__get__(gui, gui.__class__)
     gui.update_subscription_ui = update_subscription_ui.__get__(gui, gui.__class__)
+    gui._run_stripe_async = _run_stripe_async.__get__(gui, gui.__class__)
 
 
 def bind_help_methods(gui):
@@ -174,7 +174,7 @@ class MailingListWindow(QDialog):
             QMessageBox.warning(self, "No Selection", "Please select at least one row.")
             return
 
-        entries = [e for e in self.manager.get_all_entries() if e[0] in selected_ids]
+        entries = self.manager.get_entries_by_ids(selected_ids)
 
         save_path, _ = QFileDialog.getSaveFileName(self, "Save Labels PDF", "labels.pdf", "PDF Files (*.pdf)")
         if save_path:
@@ -3,7 +3,7 @@ import socketio
 import hashlib
 import logging
 import requests
-from datetime import timedelta, datetime
+from datetime import datetime
 
 
 from cloud_database_qt import CloudDatabaseManager
@@ -13,7 +13,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QGridLayout, QGroupBox, QFileDialog, QMessageBox, QInputDialog,
     QTextBrowser, QDialog, QApplication, QSizePolicy
 )
-from cloud_database_qt import CloudDatabaseManager
 
 from PySide6.QtGui import QPixmap, QFont, QCursor, QClipboard, QKeySequence, QShortcut, QDesktopServices
 from PySide6.QtCore import Qt, QTimer, Signal, QUrl
@@ -25,6 +24,7 @@ from stripe_service_qt import StripeService
 from reportlab.lib.units import inch
 from annotate_labels_qt import annotate_whatnot_pdf_with_bins_and_firstname
 from dotenv import load_dotenv
+from packaging.version import Version
 from gui_layout import setup_ui
 from gui_help_qt import (
     show_giveaway_help, show_telegram_help, show_import_csv_help,
@@ -61,12 +61,16 @@ class SwiftSaleGUI(QMainWindow):
         self.default_y_offset_in = 5.4
 
         self.current_version = "4"
+        self._current_ver = Version(self.current_version)
         self.dev_access_granted = dev_access_granted
         self.log_info = log_info
         self.log_error = log_error
         self.stripe_service = stripe_service
         self.api_token = api_token.strip()
         self.base_url = base_url
+        self._update_session = requests.Session()
+        self._last_etag = None
+        self._latest_version = None
         self.telegram_bot_token = telegram_bot_token
         self.telegram_chat_id = telegram_chat_id
         self.cloud_db = None
@@ -179,7 +183,8 @@ class SwiftSaleGUI(QMainWindow):
         # Initialize timer attributes
         self.show_start_time = None
         self.is_timer_paused = False
-        self.elapsed_before_pause = timedelta(0)
+        self._monotonic_start = 0.0
+        self._elapsed_seconds_base = 0
         self.timer = QTimer(self)
 
         # Bind methods that define UI-related functions
@@ -585,27 +590,23 @@ class SwiftSaleGUI(QMainWindow):
                 self.bidder_manager.print_bidders()
                 bidders = self.bidder_manager.bidders
 
-            # Ensure the order of insertion respects the incoming bidders dict
-            for username, info in bidders.items():
-                parent = QTreeWidgetItem([
-                    info["original_username"],
-                    "",
-                    str(info["bin"]) if info["bin"] is not None else "",
-                    "", "", ""
+            # Ensure the order of insertion respects the incoming bidders dict.
+            # Items are built in one pass and handed to Qt in bulk.
+            parents = []
+            for info in bidders.values():
+                b = info["bin"]
+                parent = QTreeWidgetItem([info["original_username"], "", "" if b is None else str(b), "", "", ""])
+                parent.addChildren([
+                    QTreeWidgetItem(["", str(t["qty"]), "", "Yes" if t["giveaway"] else "No", str(t["weight"]) if t["weight"] else "", t["timestamp"]])
+                    for t in info["transactions"]
                 ])
-                parent.setExpanded(False)
-                self.bidders_tree.addTopLevelItem(parent)
-
-                for t in info["transactions"]:
-                    child = QTreeWidgetItem([
-                        "", str(t["qty"]), "",
-                        "Yes" if t["giveaway"] else "No",
-                        str(t["weight"]) if t["weight"] else "",
-                        t["timestamp"]
-                    ])
-                    parent.addChild(child)
-
-            self.bidders_tree.resizeColumnToContents(0)
+                parents.append(parent)
+            self.bidders_tree.addTopLevelItems(parents)
+
+            # Size the username column from the names directly instead of letting Qt walk every item
+            fm = self.bidders_tree.fontMetrics()
+            max_w = max((fm.horizontalAdvance(info["original_username"]) for info in bidders.values()), default=80) + 16
+            self.bidders_tree.setColumnWidth(0, max_w)
             # NOTE: Do NOT re-enable Qt sorting here — it will override our custom order
             # self.bidders_tree.setSortingEnabled(True)
 
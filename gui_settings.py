@@ -38,8 +38,11 @@ def save_settings_to_json(self):
             "flash_sale_announcement_text": self.flash_sale_entry.text(),
             "multi_buyer_mode": self.multi_buyer_check.isChecked(),
         }
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(data, f, indent=4)
+        # Write to a temp file and swap it in so a crash never leaves a partial file
+        tmp = SETTINGS_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, SETTINGS_FILE)
 
         # Also update runtime attributes
         self.chat_id = data["chat_id"]
@@ -49,7 +52,8 @@ def save_settings_to_json(self):
         self.multi_buyer_mode = data["multi_buyer_mode"]
 
         self.log_info("Settings saved to settings.json")
-        QMessageBox.information(self, "Success", "Settings saved successfully")
+        if hasattr(self, "statusBar"):
+            self.statusBar().showMessage("Settings saved", 3000)
     except Exception as e:
         self.log_error(f"Failed to save settings.json: {e}")
         QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
@@ -1,10 +1,18 @@
 from PySide6.QtWidgets import QMessageBox, QTreeWidgetItem
+import operator
 import sqlite3
+import sys
+
+def _sorted_bidders(bidders, descending=False):
+    """Return bidders ordered by bin, with unassigned bins always last."""
+    sentinel = -sys.maxsize - 1 if descending else sys.maxsize
+    keyed = [(sentinel if v["bin"] is None else v["bin"], k, v) for k, v in bidders.items()]
+    keyed.sort(key=operator.itemgetter(0), reverse=descending)
+    return {k: v for _, k, v in keyed}
 
 def sort_bins_ascending(self):
     try:
-        sorted_items = sorted(self.bidder_manager.bidders.items(), key=lambda x: (x[1]["bin"] is None, x[1]["bin"]))
-        sorted_dict = dict(sorted_items)
+        sorted_dict = _sorted_bidders(self.bidder_manager.bidders)
         self.populate_bidders_tree(bidders=sorted_dict)
         self.log_info("Sorted bidders by bin ascending")
     except Exception as e:
@@ -13,8 +21,7 @@ def sort_bins_ascending(self):
 
 def sort_bins_descending(self):
     try:
-        sorted_items = sorted(self.bidder_manager.bidders.items(), key=lambda x: (x[1]["bin"] is None, -1 if x[1]["bin"] is None else -x[1]["bin"]))
-        sorted_dict = dict(sorted_items)
+        sorted_dict = _sorted_bidders(self.bidder_manager.bidders, descending=True)
         self.populate_bidders_tree(bidders=sorted_dict)
         self.log_info("Sorted bidders by bin descending")
     except Exception as e:
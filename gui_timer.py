@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QMessageBox
-from datetime import datetime, timedelta
+from datetime import datetime
+import time
 
 def start_show(self):
     """Start the show, reset blinking state, and start the timer."""
@@ -14,7 +15,8 @@ def start_show(self):
         self.bidder_manager.start_show()
         self.show_avg_sell_rate(show_message=False)
         self.show_start_time = datetime.now()
-        self.elapsed_before_pause = timedelta(0)
+        self._monotonic_start = time.monotonic()
+        self._elapsed_seconds_base = 0.0
         self.is_timer_paused = False
         self.timer.start(1000)
         self.update_timer_display()
@@ -30,14 +32,15 @@ def pause_timer(self):
         return
 
     if self.is_timer_paused:
-        self.show_start_time = datetime.now()
+        self._monotonic_start = time.monotonic()
         self.is_timer_paused = False
         self.timer.start(1000)
         self.pause_button.setText("Pause Timer")
         self.log_info("Timer resumed")
     else:
         self.timer.stop()
-        self.elapsed_before_pause += datetime.now() - self.show_start_time
+        # Keep the fractional second so pause/resume cycles don't drift
+        self._elapsed_seconds_base += time.monotonic() - self._monotonic_start
         self.is_timer_paused = True
         self.pause_button.setText("Resume Timer")
         self.log_info("Timer paused")
@@ -46,7 +49,7 @@ def stop_timer(self):
     """Fully stop and reset the timer."""
     self.timer.stop()
     self.show_start_time = None
-    self.elapsed_before_pause = timedelta(0)
+    self._elapsed_seconds_base = 0.0
     self.is_timer_paused = False
     self.timer_label.setText("00:00:00")
     self.pause_button.setText("Pause Timer")
@@ -57,12 +60,10 @@ def update_timer_display(self):
     if self.show_start_time is None or self.is_timer_paused:
         return
     try:
-        elapsed = datetime.now() - self.show_start_time + self.elapsed_before_pause
-        hours = int(elapsed.total_seconds() // 3600)
-        minutes = int((elapsed.total_seconds() % 3600) // 60)
-        seconds = int(elapsed.total_seconds() % 60)
+        secs = int(time.monotonic() - self._monotonic_start + self._elapsed_seconds_base)
+        hours, rem = divmod(secs, 3600)
+        minutes, seconds = divmod(rem, 60)
         self.timer_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-        self.log_info(f"Updated timer display: {hours:02d}:{minutes:02d}:{seconds:02d}")
     except Exception as e:
         self.log_error(f"Failed to update timer display: {e}")
         self.timer_label.setText("00:00:00")
@@ -1,8 +1,9 @@
 def toggle_treeview(self):
     """Toggle the visibility of the bidders table."""
-    self.tree_frame.setVisible(not self.tree_frame.isVisible())
-    self.toggle_button.setText("−" if self.tree_frame.isVisible() else "+")
-    self.log_info(f"Bidders table visibility: {self.tree_frame.isVisible()}")
+    new_visible = not self.tree_frame.isVisible()
+    self.tree_frame.setVisible(new_visible)
+    self.toggle_button.setText("−" if new_visible else "+")
+    self.log_info(f"Bidders table visibility: {new_visible}")
 
 def bind_toggle_methods(gui):
     """Bind toggle-related methods to the GUI instance."""
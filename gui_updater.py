@@ -1,24 +1,72 @@
 from PySide6.QtWidgets import QMessageBox
-import requests
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from packaging.version import Version
+
+
+class _UpdateCheckSignals(QObject):
+    done = Signal(dict)
+    failed = Signal(str)
+
+
+class _UpdateCheckTask(QRunnable):
+    """Fetch the published version on a pool thread and report back via signals."""
+
+    def __init__(self, session, base_url, etag):
+        super().__init__()
+        self.session = session
+        self.base_url = base_url
+        self.etag = etag
+        self.signals = _UpdateCheckSignals()
+
+    def run(self):
+        try:
+            headers = {"If-None-Match": self.etag} if self.etag else {}
+            r = self.session.get(f"{self.base_url}/version", headers=headers, timeout=5)
+            if r.status_code == 304:
+                self.signals.done.emit({"not_modified": True})
+            elif r.ok:
+                self.signals.done.emit({"version": r.json().get("version"), "etag": r.headers.get("ETag")})
+            else:
+                raise Exception("Failed to check version")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
 
 def check_for_updates(self):
-    """Check for software updates."""
+    """Check for software updates without blocking the GUI thread."""
+    task = _UpdateCheckTask(self._update_session, self.base_url, self._last_etag)
+    task.signals.done.connect(self._on_update_check_done, Qt.QueuedConnection)
+    task.signals.failed.connect(self._on_update_check_failed, Qt.QueuedConnection)
+    # Keep a reference so the signals object outlives the pool thread
+    self._update_check_task = task
+    QThreadPool.globalInstance().start(task)
+
+def _on_update_check_done(self, result):
+    """Compare the fetched version against the running one and notify the user."""
     try:
-        r = requests.get(f"{self.base_url}/version", timeout=5)
-        if r.ok:
-            latest_version = r.json().get("version", self.current_version)
-            if latest_version > self.current_version:
-                QMessageBox.information(self, "Update Available", f"New version {latest_version} is available. Please update.")
-                self.log_info(f"Update available: {latest_version}")
-            else:
-                QMessageBox.information(self, "No Update", "You are running the latest version.")
-                self.log_info("No update available")
+        if result.get("not_modified") and self._latest_version is not None:
+            # Server confirmed the cached version is still current
+            latest_version = self._latest_version
         else:
-            raise Exception("Failed to check version")
+            latest_version = Version(result.get("version") or self.current_version)
+            self._latest_version = latest_version
+            self._last_etag = result.get("etag")
+
+        if latest_version > self._current_ver:
+            QMessageBox.information(self, "Update Available", f"New version {latest_version} is available. Please update.")
+            self.log_info(f"Update available: {latest_version}")
+        else:
+            QMessageBox.information(self, "No Update", "You are running the latest version.")
+            self.log_info("No update available")
     except Exception as e:
-        self.log_error(f"Failed to check for update: {e}")
-        QMessageBox.critical(self, "Error", f"Failed to check for update: {e}")
+        self._on_update_check_failed(str(e))
+
+def _on_update_check_failed(self, message):
+    self.log_error(f"Failed to check for update: {message}")
+    QMessageBox.critical(self, "Error", f"Failed to check for update: {message}")
 
 def bind_updater_methods(gui):
     """Bind only the version check to the GUI instance."""
     gui.check_for_updates = check_for_updates.__get__(gui, gui.__class__)
+    gui._on_update_check_done = _on_update_check_done.__get__(gui, gui.__class__)
+    gui._on_update_check_failed = _on_update_check_failed.__get__(gui, gui.__class__)
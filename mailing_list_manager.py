@@ -1,5 +1,11 @@
+import logging
 import os
 import sqlite3
+import threading
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
 from datetime import datetime
 
 # Derive a default path for the mailing list database.  On Windows the
@@ -7,23 +13,178 @@ from datetime import datetime
 # data directory.  However, this variable may be undefined on other
 # platforms (e.g. Linux/macOS).  In those cases fall back to the user's
 # home directory to ensure the application still functions without raising
-# ``TypeError`` when ``os.path.join`` receives ``None``.  The database
-# itself is stored under a ``SwiftSale`` subdirectory.
-_appdata = os.getenv("LOCALAPPDATA")
-if not _appdata:
-    _appdata = os.path.expanduser("~")
-MAILING_DB_PATH = os.path.join(_appdata, "SwiftSale", "mailing_list.db")
+# ``TypeError`` when the path is built from ``None``.  The database itself
+# is stored under a ``SwiftSale`` subdirectory, created once at import.
+MAILING_DIR = Path(os.getenv("LOCALAPPDATA") or Path.home()) / "SwiftSale"
+MAILING_DIR.mkdir(parents=True, exist_ok=True)
+MAILING_DB_PATH = str(MAILING_DIR / "mailing_list.db")
+
+# Database paths whose parent directory has already been created this process.
+_DIR_ENSURED = {MAILING_DB_PATH}
+
+# db_path -> [connection, lock, open manager count], shared by every
+# MailingListManager on the same file.
+_SHARED_CONNECTIONS = {}
+_SHARED_GUARD = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever _ensure_table_exists gains a migration step.
+_SCHEMA_VERSION = 4
+
+# Rows written per transaction when importing a CSV.
+_CSV_COMMIT_EVERY = 10_000
+# CSV columns read by bulk_import_emails_from_csv, in unpacking order.
+_CSV_FIELDS = (
+    "full_name", "email", "address_line_1", "city", "state", "zip_code", "order_date", "order_id"
+)
+
+# Hot-path statements kept as constants so the connection's statement cache
+# matches on identical text and skips re-parsing them.  Duplicate detection
+# relies on the ``ux_mailing_identity`` unique index rather than a SELECT.
+_IDENTITY_COLUMNS = "full_name, address_line_1, city, state, zip_code"
+_SQL_INSERT = f"""
+    INSERT INTO mailing_list
+    (full_name, username, email, address_line_1, address_line_2, city, state, zip_code, spent, order_date, order_id, checked)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+    ON CONFLICT({_IDENTITY_COLUMNS}) DO NOTHING
+"""
+_CSV_UPSERT_TEMPLATE = f"""
+    INSERT INTO mailing_list (
+        full_name, username, email, address_line_1, address_line_2,
+        city, state, zip_code, order_date, order_id, num_orders, checked
+    ) VALUES {{values}}
+    ON CONFLICT({_IDENTITY_COLUMNS}) DO UPDATE SET email = excluded.email
+"""
+_CSV_ROW_VALUES = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, 0)"
+# Rows per multi-VALUES upsert; 500 rows x 10 parameters stays well under
+# SQLite's bound-parameter limit.
+_CSV_VALUES_CHUNK = 500
+_SQL_CSV_UPSERT = _CSV_UPSERT_TEMPLATE.format(values=_CSV_ROW_VALUES)
+_SQL_CSV_UPSERT_CHUNK = _CSV_UPSERT_TEMPLATE.format(
+    values=", ".join([_CSV_ROW_VALUES] * _CSV_VALUES_CHUNK)
+)
+# Narrow projection for list views that do not need order details.
+_COLS = "id, full_name, username, email, address_line_1, address_line_2, city, state, zip_code, spent, checked"
+# id breaks ties so LIMIT/OFFSET pages never repeat or skip rows with equal
+# sort keys; it follows each index's own order, so no extra sort is needed.
+_ORDER_BY_SPENT = "ORDER BY spent DESC, id DESC"
+_ORDER_BY_NAME = "ORDER BY full_name COLLATE NOCASE ASC, id ASC"
+_SQL_SET_CHECKED = "UPDATE mailing_list SET checked = ? WHERE id = ?"
+_SQL_GET_BY_ID = "SELECT * FROM mailing_list WHERE id = ?"
+_SQL_GET_CHECKED = f"SELECT {_COLS} FROM mailing_list WHERE checked = 1"
+_SQL_GET_CHECKED_IDS = "SELECT id FROM mailing_list WHERE checked = 1"
+_SQL_CHECKED_SPENT_TOTAL = "SELECT COALESCE(SUM(spent), 0) FROM mailing_list WHERE checked = 1"
+_SQL_COUNT = "SELECT COUNT(*) FROM mailing_list"
+# Rows read per batch by MailingListManager.iter_entries.
+_ITER_FETCH_SIZE = 500
+
+# Secondary indexes, by name.  ix_full_name_nocase matches the name
+# ORDER BY exactly; ix_checked_spent is a partial index that carries id and
+# spent so the checked-row helpers never touch the table.  The unique
+# identity index is not listed here since the upserts depend on it.
+_SECONDARY_INDEXES = {
+    "ix_full_name_nocase": "CREATE INDEX IF NOT EXISTS ix_full_name_nocase ON mailing_list(full_name COLLATE NOCASE);",
+    "ix_spent": "CREATE INDEX IF NOT EXISTS ix_spent ON mailing_list(spent);",
+    "ix_order_date": "CREATE INDEX IF NOT EXISTS ix_order_date ON mailing_list(order_date);",
+    "ix_state": "CREATE INDEX IF NOT EXISTS ix_state ON mailing_list(state);",
+    "ix_checked_spent": "CREATE INDEX IF NOT EXISTS ix_checked_spent ON mailing_list(checked, spent) WHERE checked = 1;",
+}
+# CSV files at least this large (roughly a thousand rows) are imported with
+# the secondary indexes dropped and rebuilt once afterwards; below it the
+# rebuild costs more than the incremental index updates it saves.
+_CSV_REBUILD_INDEXES_BYTES = 128 * 1024
+
+
+@lru_cache(maxsize=64)
+def _compile_search_query(clauses, narrow, sort_by_spent, paged):
+    """Assemble the search_entries SQL; calls with the same filter shape reuse the string."""
+    query = f"SELECT {_COLS if narrow else '*'} FROM mailing_list"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " " + (_ORDER_BY_SPENT if sort_by_spent else _ORDER_BY_NAME)
+    if paged:
+        query += " LIMIT ? OFFSET ?"
+    return query
+
+
+def close_all_connections():
+    """Close every shared mailing list connection; used at application shutdown."""
+    with _SHARED_GUARD:
+        for conn, lock, _ in _SHARED_CONNECTIONS.values():
+            with lock:
+                conn.close()
+        _SHARED_CONNECTIONS.clear()
 
 
 class MailingListManager:
     def __init__(self, db_path=MAILING_DB_PATH):
         self.db_path = db_path
+        # One long-lived connection shared by every method; reopening the
+        # database file per call dominated the cost of small queries.  Managers
+        # opened on the same file in this process also share that connection
+        # (and its page cache).  ``:memory:`` is private by definition.
+        with _SHARED_GUARD:
+            shared = _SHARED_CONNECTIONS.get(db_path) if db_path != ":memory:" else None
+            opened = shared is None
+            if opened:
+                shared = [self._connect(), threading.Lock(), 0]
+                if db_path != ":memory:":
+                    _SHARED_CONNECTIONS[db_path] = shared
+            shared[2] += 1
+        self._conn, self._lock = shared[0], shared[1]
+        self._shared = shared
+        if opened:
+            self._configure_connection()
         self._ensure_table_exists()
 
+    def _connect(self):
+        if self.db_path != ":memory:" and self.db_path not in _DIR_ENSURED:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            _DIR_ENSURED.add(self.db_path)
+        return sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+
+    def _configure_connection(self):
+        # Rows support both named and positional access, so existing
+        # index-based consumers keep working.
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets the viewer keep reading while checkbox toggles write.
+        # In-memory databases have no journal file, so WAL does not apply.
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute("PRAGMA temp_store=MEMORY;")
+        self._conn.execute("PRAGMA cache_size=-65536;")
+        self._conn.execute("PRAGMA busy_timeout=5000;")
+        self._conn.execute("PRAGMA mmap_size=268435456;")
+
+    def close(self):
+        """Release this manager's handle; the last one closes the connection."""
+        with _SHARED_GUARD:
+            if self._conn is None:
+                return
+            self._shared[2] -= 1
+            if self._shared[2] == 0:
+                _SHARED_CONNECTIONS.pop(self.db_path, None)
+                with self._lock:
+                    self._conn.close()
+            self._conn = None
+
     def _ensure_table_exists(self):
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
+            # Migrations below only need to run once per database file
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] == _SCHEMA_VERSION:
+                # Cheap no-ops normally, but they restore the secondary indexes
+                # if a bulk import died after dropping them.
+                for ddl in _SECONDARY_INDEXES.values():
+                    cursor.execute(ddl)
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'mailing_list_fts'")
+                self._fts = cursor.fetchone() is not None
+                return
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS mailing_list (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -50,63 +211,236 @@ class MailingListManager:
                 cursor.execute("ALTER TABLE mailing_list ADD COLUMN spent REAL DEFAULT 0.0;")
             if "checked" not in existing_columns:
                 cursor.execute("ALTER TABLE mailing_list ADD COLUMN checked INTEGER DEFAULT 0;")
-            conn.commit()
+            try:
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS ux_mailing_identity ON mailing_list({_IDENTITY_COLUMNS});"
+                )
+            except sqlite3.IntegrityError:
+                # Databases written before the index existed may hold exact
+                # duplicates; keep the oldest row of each before indexing.
+                # Matching with = mirrors the unique index, which treats NULLs
+                # as distinct, so rows with a missing identity column survive.
+                same_identity = " AND ".join(
+                    f"older.{col} = mailing_list.{col}" for col in _IDENTITY_COLUMNS.split(", ")
+                )
+                # Fold the newer duplicates' flags into the surviving row first.
+                # MAX rather than SUM for spent: a duplicate is the same buyer
+                # imported again, not a separate order.
+                same_as_dup = same_identity.replace("older.", "dup.")
+                cursor.execute(f"""
+                    UPDATE mailing_list SET
+                        spent = (SELECT MAX(dup.spent) FROM mailing_list AS dup WHERE {same_as_dup}),
+                        checked = (SELECT MAX(dup.checked) FROM mailing_list AS dup WHERE {same_as_dup})
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM mailing_list AS older
+                        WHERE older.id < mailing_list.id AND {same_identity}
+                    ) AND EXISTS (
+                        SELECT 1 FROM mailing_list AS dup
+                        WHERE dup.id > mailing_list.id AND {same_as_dup}
+                    )
+                """)
+                cursor.execute(f"""
+                    DELETE FROM mailing_list WHERE EXISTS (
+                        SELECT 1 FROM mailing_list AS older
+                        WHERE older.id < mailing_list.id AND {same_identity}
+                    )
+                """)
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS ux_mailing_identity ON mailing_list({_IDENTITY_COLUMNS});"
+                )
+            for ddl in _SECONDARY_INDEXES.values():
+                cursor.execute(ddl)
+            self._fts = self._ensure_fts_index(cursor)
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
-    def add_or_update_entry(self, entry):
-        conn = sqlite3.connect(self.db_path)
+    def _ensure_fts_index(self, cursor):
+        """
+        Maintain a trigram FTS5 index over the substring-searchable columns.
+
+        Returns False when the SQLite build lacks FTS5 or the trigram
+        tokenizer, in which case ``search_entries`` keeps using LIKE.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'mailing_list_fts'")
+        exists = cursor.fetchone() is not None
         try:
-            cursor = conn.cursor()
             cursor.execute("""
-                SELECT 1 FROM mailing_list
-                WHERE full_name = ? AND address_line_1 = ? AND city = ? AND state = ? AND zip_code = ?
-            """, (
+                CREATE VIRTUAL TABLE IF NOT EXISTS mailing_list_fts USING fts5(
+                    full_name, username, city,
+                    content='mailing_list', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS mailing_list_fts_ai AFTER INSERT ON mailing_list BEGIN
+                INSERT INTO mailing_list_fts(rowid, full_name, username, city)
+                VALUES (new.id, new.full_name, new.username, new.city);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS mailing_list_fts_ad AFTER DELETE ON mailing_list BEGIN
+                INSERT INTO mailing_list_fts(mailing_list_fts, rowid, full_name, username, city)
+                VALUES ('delete', old.id, old.full_name, old.username, old.city);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS mailing_list_fts_au AFTER UPDATE OF full_name, username, city
+            ON mailing_list BEGIN
+                INSERT INTO mailing_list_fts(mailing_list_fts, rowid, full_name, username, city)
+                VALUES ('delete', old.id, old.full_name, old.username, old.city);
+                INSERT INTO mailing_list_fts(rowid, full_name, username, city)
+                VALUES (new.id, new.full_name, new.username, new.city);
+            END
+        """)
+        if not exists:
+            # Index rows written before the FTS table existed
+            cursor.execute("INSERT INTO mailing_list_fts(mailing_list_fts) VALUES ('rebuild')")
+        return True
+
+    # search_entries filters matched anywhere in a column (FTS or LIKE)
+    _SUBSTRING_FILTERS = (
+        ("name", "full_name"),
+        ("username", "username"),
+        ("city", "city"),
+    )
+    # search_entries filters as (key, SQL predicate, parameter transform,
+    # whether falsy values such as 0 still apply)
+    _VALUE_FILTERS = (
+        ("state", "state LIKE ?", lambda v: f"%{v}%", False),
+        ("spent_min", "spent >= ?", None, True),
+        ("spent_max", "spent <= ?", None, True),
+        ("date", "order_date = ?", None, False),
+    )
+
+    def _substring_filter(self, column, term):
+        """Return an SQL predicate and parameter matching ``term`` anywhere in ``column``."""
+        # Trigram MATCH needs at least three characters; shorter terms fall back to LIKE.
+        if self._fts and len(term) >= 3:
+            escaped = term.replace('"', '""')
+            return (
+                "id IN (SELECT rowid FROM mailing_list_fts WHERE mailing_list_fts MATCH ?)",
+                f'{column} : "{escaped}"',
+            )
+        return f"{column} LIKE ?", f"%{term}%"
+
+    def add_or_update_entry(self, entry):
+        if not self.add_or_update_entries([entry]):
+            print(f"[INFO] Duplicate mailing entry skipped for {entry['full_name']}")
+
+    def add_or_update_entries(self, entries):
+        """
+        Insert several entries in one transaction, skipping duplicates.
+
+        Returns the number of rows actually inserted.
+        """
+        params = [
+            (
                 entry["full_name"],
+                entry["username"],
+                entry["email"],
                 entry["address_line_1"],
+                entry["address_line_2"],
                 entry["city"],
                 entry["state"],
-                entry["zip_code"]
-            ))
-            if cursor.fetchone():
-                print(f"[INFO] Duplicate mailing entry skipped for {entry['full_name']}")
-            else:
-                cursor.execute("""
-                    INSERT INTO mailing_list 
-                    (full_name, username, email, address_line_1, address_line_2, city, state, zip_code, spent, order_date, order_id, checked)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-                """, (
-                    entry["full_name"],
-                    entry["username"],
-                    entry["email"],
-                    entry["address_line_1"],
-                    entry["address_line_2"],
-                    entry["city"],
-                    entry["state"],
-                    entry["zip_code"],
-                    entry.get("spent", 0.0),
-                    entry.get("order_date"),
-                    entry.get("order_id")
-                ))
-            conn.commit()
-        finally:
-            conn.close()
+                entry["zip_code"],
+                entry.get("spent", 0.0),
+                entry.get("order_date"),
+                entry.get("order_id")
+            )
+            for entry in entries
+        ]
+        if not params:
+            return 0
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany(_SQL_INSERT, params)
+                # DO NOTHING conflicts are not counted; trigger writes never are
+                inserted = cursor.rowcount
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        return inserted
 
     def set_entry_checked(self, entry_id, checked=True):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE mailing_list SET checked = ? WHERE id = ?",
-                (1 if checked else 0, entry_id)
-            )
-            print(f"[DEBUG] DB updated: entry {entry_id} -> checked={checked}")
-            conn.commit()
+        with self._lock:
+            self._conn.execute(_SQL_SET_CHECKED, (1 if checked else 0, entry_id))
+            logger.debug("DB updated: entry %s -> checked=%s", entry_id, checked)
+
+    def set_entries_checked(self, entry_ids, checked=True):
+        """Set the ``checked`` flag on many entries in a single transaction."""
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return
+        placeholders = ", ".join("?" * len(entry_ids))
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(
+                    f"UPDATE mailing_list SET checked = ? WHERE id IN ({placeholders})",
+                    (1 if checked else 0, *entry_ids)
+                )
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
 
     def get_checked_entries(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM mailing_list WHERE checked = 1")
-            return cursor.fetchall()
+        with self._lock:
+            return self._conn.execute(_SQL_GET_CHECKED).fetchall()
+
+    def get_checked_ids(self):
+        """Return only the IDs of checked entries."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(_SQL_GET_CHECKED_IDS)]
+
+    def get_checked_spent_total(self):
+        """Return the total ``spent`` across checked entries, summed in SQLite."""
+        with self._lock:
+            return float(self._conn.execute(_SQL_CHECKED_SPENT_TOTAL).fetchone()[0])
+
+    def _filter_clauses(self, filters):
+        """Return the WHERE predicates (as a tuple) and parameters for ``filters``."""
+        clauses = []
+        params = []
+        if filters:
+            for key, column in self._SUBSTRING_FILTERS:
+                value = filters.get(key)
+                if value:
+                    clause, param = self._substring_filter(column, value)
+                    clauses.append(clause)
+                    params.append(param)
+            for key, clause, transform, keep_falsy in self._VALUE_FILTERS:
+                value = filters.get(key)
+                if value is None or not (value or keep_falsy):
+                    continue
+                clauses.append(clause)
+                params.append(transform(value) if transform else value)
+        return tuple(clauses), params
+
+    def get_match_counts(self, filters=None):
+        """Return ``(matching, checked)`` row counts for the ``search_entries`` filters."""
+        clauses, params = self._filter_clauses(filters)
+        query = "SELECT COUNT(*), COALESCE(SUM(checked), 0) FROM mailing_list"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            matching, checked = self._conn.execute(query, params).fetchone()
+        return matching, checked
 
-    def search_entries(self, filters=None, sort_by_spent=False):
+    def set_matching_checked(self, filters=None, checked=True):
+        """Set the ``checked`` flag on every entry matching the filters in one UPDATE."""
+        clauses, params = self._filter_clauses(filters)
+        query = "UPDATE mailing_list SET checked = ?"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            self._conn.execute(query, (1 if checked else 0, *params))
+
+    def search_entries(self, filters=None, sort_by_spent=False, narrow=False, limit=None, offset=0):
         """
         Retrieve mailing list entries matching the provided filter criteria.
 
@@ -127,77 +461,72 @@ class MailingListManager:
             Whether to sort results descending by amount spent.  If false,
             results are sorted alphabetically by ``full_name``.
 
+        narrow : bool, default False
+            Select only the ``_COLS`` projection instead of every column.
+
+        limit, offset : int, optional
+            Return at most ``limit`` rows starting at ``offset``; all rows
+            are returned when ``limit`` is None.
+
         Returns
         -------
-        list of tuple
+        list of sqlite3.Row
             Rows from the ``mailing_list`` table matching the filters.
         """
-        query = "SELECT * FROM mailing_list WHERE 1=1"
-        params = []
-        if filters:
-            # Name substring (first or last name)
-            name_filter = filters.get("name")
-            if name_filter:
-                query += " AND full_name LIKE ?"
-                params.append(f"%{name_filter}%")
-            # Username substring
-            username_filter = filters.get("username")
-            if username_filter:
-                query += " AND username LIKE ?"
-                params.append(f"%{username_filter}%")
-            # City substring
-            city_filter = filters.get("city")
-            if city_filter:
-                query += " AND city LIKE ?"
-                params.append(f"%{city_filter}%")
-            # State substring or exact match
-            state_filter = filters.get("state")
-            if state_filter:
-                query += " AND state LIKE ?"
-                params.append(f"%{state_filter}%")
-            # Spent boundaries
-            spent_min = filters.get("spent_min")
-            if spent_min is not None:
-                query += " AND spent >= ?"
-                params.append(spent_min)
-            spent_max = filters.get("spent_max")
-            if spent_max is not None:
-                query += " AND spent <= ?"
-                params.append(spent_max)
-            # Exact order date match
-            date_filter = filters.get("date")
-            if date_filter:
-                query += " AND order_date = ?"
-                params.append(date_filter)
-        # Sorting
-        if sort_by_spent:
-            query += " ORDER BY spent DESC"
-        else:
-            query += " ORDER BY full_name COLLATE NOCASE ASC"
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchall()
+        clauses, params = self._filter_clauses(filters)
+        query = _compile_search_query(clauses, narrow, sort_by_spent, limit is not None)
+        if limit is not None:
+            params.extend((limit, offset))
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
 
-    def get_all_entries(self, sort_by_spent=False):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            order_clause = "ORDER BY spent DESC" if sort_by_spent else "ORDER BY full_name COLLATE NOCASE ASC"
-            cursor.execute(f"SELECT * FROM mailing_list {order_clause}")
-            return cursor.fetchall()
+    def iter_entries(self, sort_by_spent=False, narrow=False, limit=None, offset=0):
+        """
+        Yield entries in display order without building the full result list.
+
+        File databases are streamed ``_ITER_FETCH_SIZE`` rows at a time
+        through a private read-only connection, so a slow consumer neither
+        holds the shared connection's lock nor pins a read transaction on it,
+        and never sees another manager's uncommitted writes.  ``:memory:``
+        has no second connection to read from, so those rows are fetched in
+        one go under the lock.
+        """
+        if self.db_path == ":memory:":
+            yield from self.get_all_entries(sort_by_spent, narrow, limit, offset)
+            return
+        # Same cached query text as an unfiltered search_entries call
+        query = _compile_search_query((), narrow, sort_by_spent, limit is not None)
+        params = () if limit is None else (limit, offset)
+        conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(_ITER_FETCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            conn.close()
+
+    def get_all_entries(self, sort_by_spent=False, narrow=False, limit=None, offset=0):
+        query = _compile_search_query((), narrow, sort_by_spent, limit is not None)
+        params = () if limit is None else (limit, offset)
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
 
     def bulk_import_emails_from_csv(self, csv_path):
         import csv
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
-        updated = 0
-        added = 0
-        skipped = 0
-        with sqlite3.connect(self.db_path) as conn:
+        counts = {"written": 0, "skipped": 0}
+        with self._lock:
+            conn = self._conn
             cursor = conn.cursor()
             with open(csv_path, newline='', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                all_headers = set(reader.fieldnames or [])
+                reader = csv.reader(csvfile)
+                header = next(reader, [])
+                all_headers = set(header)
                 required_headers = {"full_name", "email"}
                 optional_headers = {
                     "address_line_1", "city", "state", "zip_code",
@@ -209,45 +538,79 @@ class MailingListManager:
                     raise ValueError(f"Missing required CSV headers: {', '.join(missing_required)}")
                 if missing_optional:
                     print(f"Warning: Optional headers missing: {', '.join(missing_optional)}")
-                for row in reader:
-                    full_name = row.get("full_name", "").strip()
-                    email = row.get("email", "").strip()
-                    address_line_1 = row.get("address_line_1", "").strip()
-                    city = row.get("city", "").strip()
-                    state = row.get("state", "").strip()
-                    zip_code = row.get("zip_code", "").strip()
-                    order_id = row.get("order_id", "").strip()
-                    order_date = row.get("order_date", "").strip()
-                    if not full_name or not email:
-                        skipped += 1
-                        continue
-                    cursor.execute("""
-                        SELECT id FROM mailing_list
-                        WHERE full_name = ? AND address_line_1 = ? AND city = ? AND state = ? AND zip_code = ?
-                    """, (full_name, address_line_1, city, state, zip_code))
-                    match = cursor.fetchone()
-                    if match:
-                        cursor.execute("UPDATE mailing_list SET email = ? WHERE id = ?", (email, match[0]))
-                        updated += 1
-                    else:
-                        cursor.execute("""
-                            INSERT INTO mailing_list (
-                                full_name, username, email, address_line_1, address_line_2,
-                                city, state, zip_code, order_date, order_id, num_orders, checked
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, 0)
-                        """, (
+                rebuild_indexes = os.path.getsize(csv_path) >= _CSV_REBUILD_INDEXES_BYTES
+                if rebuild_indexes:
+                    for name in _SECONDARY_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                # One transaction for the whole file instead of one per statement;
+                # commit every _CSV_COMMIT_EVERY rows to keep the WAL bounded.
+                cursor.execute("BEGIN IMMEDIATE")
+                rows_before = conn.execute(_SQL_COUNT).fetchone()[0]
+
+                # Plain csv.reader rows are indexed by precomputed column
+                # positions instead of building a dict per row.  Each row is
+                # normalised to the header width plus one blank cell, which
+                # stands in for any missing optional column.
+                width = len(header)
+                blanks = [""] * width
+                get_fields = itemgetter(*(
+                    header.index(name) if name in all_headers else width for name in _CSV_FIELDS
+                ))
+
+                # Stream parsed rows straight into executemany; tallies are
+                # kept as a side effect since the generator is consumed lazily.
+                def upsert_rows():
+                    for row in reader:
+                        if not row:
+                            continue
+                        if len(row) != width:
+                            row = (row + blanks)[:width]
+                        row.append("")
+                        full_name, email, address_line_1, city, state, zip_code, order_date, order_id = map(
+                            str.strip, get_fields(row)
+                        )
+                        if not full_name or not email:
+                            counts["skipped"] += 1
+                            continue
+                        counts["written"] += 1
+                        yield (
                             full_name, '', email, address_line_1, '',
                             city, state, zip_code, order_date, order_id
-                        ))
-                        added += 1
-            conn.commit()
-        return {"updated": updated, "added": added, "skipped": skipped}
+                        )
+
+                rows = upsert_rows()
+                try:
+                    while True:
+                        batch = list(islice(rows, _CSV_COMMIT_EVERY))
+                        if not batch:
+                            break
+                        # Full chunks go through one multi-row statement each;
+                        # the tail uses the single-row statement.
+                        full = len(batch) - len(batch) % _CSV_VALUES_CHUNK
+                        for start in range(0, full, _CSV_VALUES_CHUNK):
+                            chunk = batch[start:start + _CSV_VALUES_CHUNK]
+                            cursor.execute(_SQL_CSV_UPSERT_CHUNK, [v for row in chunk for v in row])
+                        cursor.executemany(_SQL_CSV_UPSERT, batch[full:])
+                        if len(batch) == _CSV_COMMIT_EVERY:
+                            cursor.execute("COMMIT")
+                            cursor.execute("BEGIN IMMEDIATE")
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+                finally:
+                    # One bulk build per index instead of per-row maintenance.
+                    if rebuild_indexes:
+                        for ddl in _SECONDARY_INDEXES.values():
+                            cursor.execute(ddl)
+            # The upsert does not say which branch it took, so derive the
+            # split from how much the table grew.
+            added = conn.execute(_SQL_COUNT).fetchone()[0] - rows_before
+        return {"updated": counts["written"] - added, "added": added, "skipped": counts["skipped"]}
 
     def clear_all_entries(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM mailing_list")
-            conn.commit()
+        with self._lock:
+            self._conn.execute("DELETE FROM mailing_list")
 
     def get_entry_by_id(self, entry_id):
         """
@@ -257,8 +620,7 @@ class MailingListManager:
             entry_id (int): The primary key of the desired mailing list record.
 
         Returns:
-            tuple | None: A tuple containing the row data if found, otherwise
-            ``None``.
+            sqlite3.Row | None: The row data if found, otherwise ``None``.
 
         This helper method allows consumers of ``MailingListManager`` to fetch
         complete address information for an individual row. It is especially
@@ -266,16 +628,32 @@ class MailingListManager:
         when rendering a table with limited fields) but still needs the full
         record for operations like label generation.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM mailing_list WHERE id = ?", (entry_id,))
-            return cursor.fetchone()
+        with self._lock:
+            return self._conn.execute(_SQL_GET_BY_ID, (entry_id,)).fetchone()
+
+    def get_entries_by_ids(self, entry_ids):
+        """
+        Retrieve full rows for several entries with a single query.
+
+        Rows are returned in the order of ``entry_ids``; unknown IDs are
+        skipped.
+        """
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return []
+        placeholders = ", ".join("?" * len(entry_ids))
+        with self._lock:
+            rows = {
+                row["id"]: row
+                for row in self._conn.execute(f"SELECT * FROM mailing_list WHERE id IN ({placeholders})", entry_ids)
+            }
+        return [rows[i] for i in entry_ids if i in rows]
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox,
     QPushButton, QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 
@@ -285,13 +663,89 @@ from reportlab.lib.units import inch
 # https://docs.python.org/3/faq/programming.html#how-can-i-have-a-variable- and
 # maintain a single copy across modules for further discussion.
 
+class _LabelExportSignals(QObject):
+    done = Signal(int)
+    failed = Signal(str)
+
+
+class _LabelExportTask(QRunnable):
+    """Load the selected entries and write the label PDF on a pool thread."""
+
+    def __init__(self, db, entry_ids, save_path):
+        super().__init__()
+        self.db = db
+        self.entry_ids = entry_ids
+        self.save_path = save_path
+        self.signals = _LabelExportSignals()
+
+    def run(self):
+        try:
+            entries = self.db.get_entries_by_ids(self.entry_ids)
+            if entries:
+                _write_labels_pdf(entries, self.save_path)
+            self.signals.done.emit(len(entries))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+def _write_labels_pdf(entries, save_path):
+    # Try to use the enhanced label generator provided in ``export_labels.py``.
+    try:
+        from export_labels import generate_labels_pdf  # type: ignore
+    except Exception:
+        generate_labels_pdf = None
+
+    if generate_labels_pdf:
+        # ``generate_labels_pdf`` handles all drawing and formatting.  It
+        # accepts a list of database tuples and the destination file path.
+        generate_labels_pdf(entries, save_path)
+        return
+
+    # Fallback to a minimal label format if the helper is not available.
+    label_width = 4 * inch
+    label_height = 6 * inch
+    c = canvas.Canvas(save_path, pagesize=(label_width, label_height))
+    for entry in entries:
+        full_name = entry[1] or ""
+        address_1 = entry[4] or ""
+        address_2 = entry[5] or ""
+        city = entry[6] or ""
+        state = entry[7] or ""
+        zip_code = entry[8] or ""
+        y = label_height - 0.5 * inch
+        c.setFont("Helvetica-Bold", 14)
+        c.drawString(0.5 * inch, y, full_name)
+        c.setFont("Helvetica", 12)
+        y -= 0.3 * inch
+        c.drawString(0.5 * inch, y, address_1)
+        if address_2:
+            y -= 0.25 * inch
+            c.drawString(0.5 * inch, y, address_2)
+        y -= 0.25 * inch
+        city_state_zip = ", ".join(filter(None, [city, state]))
+        if zip_code:
+            city_state_zip = f"{city_state_zip} {zip_code}" if city_state_zip else zip_code
+        c.drawString(0.5 * inch, y, city_state_zip)
+        c.showPage()
+    c.save()
+
+
 class MailingListViewer(QWidget):
-    def __init__(self):
+    # Rows materialised in the table at once; Previous/Next page through the rest.
+    PAGE_SIZE = 200
+    # Row fields shown in table columns 1-7, in order
+    _TEXT_COLUMNS = (
+        "full_name", "username", "email", "address_line_1", "address_line_2", "city", "state"
+    )
+
+    def __init__(self, db=None):
         super().__init__()
         self.setWindowTitle("Mailing List Viewer")
         self.setMinimumSize(800, 600)
 
-        self.db = MailingListManager()
+        self.db = db or MailingListManager()
+        self._filters = None
+        self._offset = 0
         layout = QVBoxLayout(self)
 
         # ------------------------------------------------------------------
@@ -362,14 +816,25 @@ class MailingListViewer(QWidget):
         self.export_button = QPushButton("Export Checked Labels (PDF)")
         self.export_button.clicked.connect(self.export_labels)
         # Add a 'Select All' button to allow users to quickly select or clear
-        # all rows for export.  When all checkboxes are already checked the
-        # button will act as "Clear All" to toggle them off.
+        # every entry matching the current search, on all pages, for export.
+        # When they are all already checked it acts as "Clear All".
         self.select_all_button = QPushButton("Select All")
         self.select_all_button.clicked.connect(self.select_all_rows)
 
         # Use a horizontal layout for the action buttons to keep them aligned.
         from PySide6.QtWidgets import QHBoxLayout
+        self.prev_button = QPushButton("Previous")
+        self.prev_button.clicked.connect(lambda: self.load_data(self._filters, self._offset - self.PAGE_SIZE))
+        self.next_button = QPushButton("Next")
+        self.next_button.clicked.connect(lambda: self.load_data(self._filters, self._offset + self.PAGE_SIZE))
+
+        # Checked count and total across every page, not just the visible one
+        self.checked_status_label = QLabel()
+
         button_layout = QHBoxLayout()
+        button_layout.addWidget(self.checked_status_label)
+        button_layout.addWidget(self.prev_button)
+        button_layout.addWidget(self.next_button)
         button_layout.addWidget(self.select_all_button)
         button_layout.addWidget(self.export_button)
         layout.addLayout(button_layout)
@@ -427,103 +892,114 @@ class MailingListViewer(QWidget):
 
     def select_all_rows(self):
         """
-        Select or deselect all checkboxes in the table.  If at least one
-        checkbox is unchecked, this will check all boxes.  Otherwise, it
-        clears all selections.  The method also updates the underlying
-        database flags via the existing ``toggle_checkbox`` mechanism.
+        Select or deselect every entry matching the current search, across
+        all pages.  If at least one match is unchecked, all matches are
+        checked; otherwise they are all cleared.  The flags are written with
+        a single UPDATE and only the visible checkboxes are refreshed, with
+        their signals blocked.
         """
-        # Determine if we should select or clear all
-        all_checked = True
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if isinstance(checkbox, QCheckBox) and not checkbox.isChecked():
-                all_checked = False
-                break
-        # Toggle each checkbox accordingly
+        matching, checked = self.db.get_match_counts(self._filters)
+        check = checked < matching
+        self.db.set_matching_checked(self._filters, checked=check)
         for row in range(self.table.rowCount()):
             checkbox = self.table.cellWidget(row, 0)
             if isinstance(checkbox, QCheckBox):
-                # Changing the check state triggers ``toggle_checkbox`` which
-                # updates the database accordingly.
-                checkbox.setChecked(not all_checked)
+                checkbox.blockSignals(True)
+                checkbox.setChecked(check)
+                checkbox.blockSignals(False)
+        self._update_checked_status()
 
-    def load_data(self, filters=None):
+    def load_data(self, filters=None, offset=0):
         """
-        Populate the table with mailing list entries.  If a ``filters``
-        dictionary is provided, only matching entries are loaded; otherwise
-        all entries are displayed sorted by amount spent.
+        Populate the table with one page of mailing list entries.  If a
+        ``filters`` dictionary is provided, only matching entries are loaded;
+        otherwise all entries are displayed sorted by amount spent.
 
         Parameters
         ----------
         filters : dict, optional
             Same format as accepted by ``MailingListManager.search_entries``.
+        offset : int, default 0
+            Index of the first row of the page to show.
         """
-        self.table.setRowCount(0)
+        self._filters = filters
+        self._offset = max(offset, 0)
+        # Fetch one extra row to learn whether a further page exists
+        page = {"narrow": True, "limit": self.PAGE_SIZE + 1, "offset": self._offset}
         if filters:
-            entries = self.db.search_entries(filters=filters, sort_by_spent=True)
+            entries = self.db.search_entries(filters=filters, sort_by_spent=True, **page)
         else:
-            entries = self.db.get_all_entries(sort_by_spent=True)
-        for row_idx, entry in enumerate(entries):
-            entry_id = entry[0]
-            checked = bool(entry[13])
-            self.table.insertRow(row_idx)
-
-            checkbox = QCheckBox()
-            checkbox.setChecked(checked)
-            # Persist the entry ID on the widget so it can be retrieved later
-            # without relying on external state or database flags.  Using a
-            # property avoids the need for hidden columns while still
-            # providing direct access to the underlying record on export.
-            checkbox.setProperty("entry_id", entry_id)
-            # Use a lambda to capture the current entry_id; include Qt in
-            # default arguments to avoid late binding issues.
-            checkbox.stateChanged.connect(lambda state, id=entry_id, qt=Qt: self.toggle_checkbox(id, state == qt.Checked))
-            self.table.setCellWidget(row_idx, 0, checkbox)
-
-            # Populate text columns; guard against missing or None values
-            self.table.setItem(row_idx, 1, QTableWidgetItem(entry[1] or ""))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(entry[2] or ""))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(entry[3] or ""))
-            self.table.setItem(row_idx, 4, QTableWidgetItem(entry[4] or ""))
-            self.table.setItem(row_idx, 5, QTableWidgetItem(entry[5] or ""))
-            self.table.setItem(row_idx, 6, QTableWidgetItem(entry[6] or ""))
-            self.table.setItem(row_idx, 7, QTableWidgetItem(entry[7] or ""))
-            # Format spent as currency
-            spent = entry[12] if len(entry) > 12 and entry[12] is not None else 0.0
-            self.table.setItem(row_idx, 8, QTableWidgetItem(f"${spent:.2f}"))
+            entries = self.db.get_all_entries(sort_by_spent=True, **page)
+        has_next = len(entries) > self.PAGE_SIZE
+        entries = entries[:self.PAGE_SIZE]
+        self.prev_button.setEnabled(self._offset > 0)
+        self.next_button.setEnabled(has_next)
+        self._update_checked_status()
+
+        # Size the table once and refill it with repaints suspended; rows
+        # kept from the previous page reuse their widgets and items.
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            # Only rows that already existed have widgets and items to reuse;
+            # new rows skip the lookups, which would just return None.
+            reused_rows = min(self.table.rowCount(), len(entries))
+            self.table.setRowCount(len(entries))
+            for row_idx, entry in enumerate(entries):
+                entry_id = entry["id"]
+                checked = bool(entry["checked"])
+
+                checkbox = self.table.cellWidget(row_idx, 0) if row_idx < reused_rows else None
+                if not isinstance(checkbox, QCheckBox):
+                    checkbox = QCheckBox()
+                    # The entry ID is read from the widget when the signal fires
+                    # so a reused checkbox always reports its current record.
+                    checkbox.stateChanged.connect(
+                        lambda state, cb=checkbox, qt=Qt: self.toggle_checkbox(cb.property("entry_id"), state == qt.Checked)
+                    )
+                    self.table.setCellWidget(row_idx, 0, checkbox)
+                # Persist the entry ID on the widget so it can be retrieved later
+                # without relying on external state or database flags.  Using a
+                # property avoids the need for hidden columns while still
+                # providing direct access to the underlying record on export.
+                checkbox.setProperty("entry_id", entry_id)
+                checkbox.blockSignals(True)
+                checkbox.setChecked(checked)
+                checkbox.blockSignals(False)
+
+                # Populate text columns; guard against missing or None values
+                spent = entry["spent"] or 0.0
+                texts = tuple(entry[col] or "" for col in self._TEXT_COLUMNS) + (f"${spent:.2f}",)
+                for col, text in enumerate(texts, start=1):
+                    item = self.table.item(row_idx, col) if row_idx < reused_rows else None
+                    if item is None:
+                        self.table.setItem(row_idx, col, QTableWidgetItem(text))
+                    else:
+                        item.setText(text)
+        finally:
+            self.table.setSortingEnabled(sorting)
+            self.table.setUpdatesEnabled(True)
 
     def toggle_checkbox(self, entry_id, is_checked):
-        print(f"[DEBUG] DB updated: entry {entry_id} -> checked={is_checked}")
         self.db.set_entry_checked(entry_id, checked=is_checked)
+        self._update_checked_status()
+
+    def _update_checked_status(self):
+        checked = len(self.db.get_checked_ids())
+        self.checked_status_label.setText(f"{checked} checked / ${self.db.get_checked_spent_total():.2f}")
 
     def export_labels(self):
         """
         Export checked entries as mailing labels in a PDF.
 
-        Instead of relying solely on the ``checked`` flag stored in the
-        database, this method inspects the state of each checkbox in the
-        table at the time the export button is pressed.  This ensures that
-        recently toggled checkboxes are respected even if the database update
-        has not yet completed or the application is using an older database
-        schema.  Each ``QCheckBox`` stores its associated record ID as a
-        property so the corresponding entry can be fetched from the
-        ``MailingListManager`` when needed.
+        The selection is read from the database ``checked`` flags, which
+        ``toggle_checkbox`` and ``select_all_rows`` write immediately, so
+        entries checked on other pages are included too.
         """
-        # Collect the selected rows by inspecting checkbox widgets directly.
-        selected_entries = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if not isinstance(checkbox, QCheckBox):
-                continue
-            if checkbox.isChecked():
-                entry_id = checkbox.property("entry_id")
-                if entry_id is None:
-                    continue
-                entry = self.db.get_entry_by_id(entry_id)
-                if entry is not None:
-                    selected_entries.append(entry)
+        selected_ids = self.db.get_checked_ids()
 
-        if not selected_entries:
+        if not selected_ids:
             QMessageBox.warning(self, "No Entries", "No checked entries to export.")
             return
 
@@ -533,45 +1009,25 @@ class MailingListViewer(QWidget):
         if not save_path:
             return
 
-        # Try to use the enhanced label generator provided in ``export_labels.py``.
-        try:
-            from export_labels import generate_labels_pdf  # type: ignore
-        except Exception:
-            generate_labels_pdf = None
-
-        if generate_labels_pdf:
-            # ``generate_labels_pdf`` handles all drawing and formatting.  It
-            # accepts a list of database tuples and the destination file path.
-            generate_labels_pdf(selected_entries, save_path)
+        # Fetch and render on a pool thread so the window stays responsive.
+        task = _LabelExportTask(self.db, selected_ids, save_path)
+        task.signals.done.connect(self._on_export_done, Qt.QueuedConnection)
+        task.signals.failed.connect(self._on_export_failed, Qt.QueuedConnection)
+        self.export_button.setEnabled(False)
+        # Keep a reference so the signals object outlives the pool thread
+        self._export_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_export_done(self, count):
+        self.export_button.setEnabled(True)
+        if count:
+            QMessageBox.information(self, "Success", "PDF Labels exported successfully.")
         else:
-            # Fallback to a minimal label format if the helper is not available.
-            label_width = 4 * inch
-            label_height = 6 * inch
-            c = canvas.Canvas(save_path, pagesize=(label_width, label_height))
-            for entry in selected_entries:
-                full_name = entry[1] or ""
-                address_1 = entry[4] or ""
-                address_2 = entry[5] or ""
-                city = entry[6] or ""
-                state = entry[7] or ""
-                zip_code = entry[8] or ""
-                y = label_height - 0.5 * inch
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(0.5 * inch, y, full_name)
-                c.setFont("Helvetica", 12)
-                y -= 0.3 * inch
-                c.drawString(0.5 * inch, y, address_1)
-                if address_2:
-                    y -= 0.25 * inch
-                    c.drawString(0.5 * inch, y, address_2)
-                y -= 0.25 * inch
-                city_state_zip = ", ".join(filter(None, [city, state]))
-                if zip_code:
-                    city_state_zip = f"{city_state_zip} {zip_code}" if city_state_zip else zip_code
-                c.drawString(0.5 * inch, y, city_state_zip)
-                c.showPage()
-            c.save()
-        QMessageBox.information(self, "Success", "PDF Labels exported successfully.")
+            QMessageBox.warning(self, "No Entries", "No checked entries to export.")
+
+    def _on_export_failed(self, message):
+        self.export_button.setEnabled(True)
+        QMessageBox.critical(self, "Export Failed", message)
 
 
 
@@ -1,26 +1,20 @@
 import os
 import sys
 import time
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
-import requests
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 import socket
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 import sqlite3
-import gc
-from PySide6.QtWidgets import QApplication
 from dotenv import load_dotenv
 
-from cloud_database_qt import CloudDatabaseManager
-from telegram_qt import TelegramService
-from bidder_manager_qt import BidderManager
-from flask_server_qt import FlaskServer
-from gui_qt import SwiftSaleGUI
-from stripe_service_qt import StripeService
 from config_qt import load_config, DEFAULT_TRIAL_EMAIL, get_or_create_install_info, save_install_info
 
 load_dotenv()
-app = QApplication.instance() or QApplication(sys.argv)
 qt_dir = os.path.abspath(os.path.dirname(__file__))
 user_data_dir = os.path.join(os.getenv('LOCALAPPDATA', os.path.expanduser("~")), 'SwiftSaleApp')
 os.makedirs(user_data_dir, exist_ok=True)
@@ -28,26 +22,32 @@ bidders_db_path = os.path.join(user_data_dir, 'bidders_qt.db')
 subs_db_path = os.path.join(user_data_dir, 'subscriptions_qt.db')
 log_file = os.path.join(user_data_dir, 'swiftsale_app.log')
 
-def custom_log(level, message):
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-    log_message = f"{timestamp} [{level}] {message}\n"
-    try:
-        sys.stdout.write(log_message)
-    except Exception:
-        pass
-    try:
-        with open(log_file, 'a') as f:
-            f.write(log_message)
-    except Exception as e:
-        sys.stderr.write(f"Failed to write to log: {e}\n")
-
-def log_info(message):
-    logging.info(message)
-    custom_log("INFO", message)
-
-def log_error(message, exc_info=False):
-    logging.error(message, exc_info=exc_info)
-    custom_log("ERROR", message)
+file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
+file_handler.setLevel(logging.INFO)
+file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setLevel(logging.INFO)
+stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+# Callers (including the GUI thread) only enqueue records; a listener thread
+# owns the file and console writes.  force=True replaces the handlers that
+# config_qt/bidder_manager_qt install at import time.
+log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)], force=True)
+# INFO records reach the file in batches; ERROR and above flush at once, and
+# logging.shutdown() flushes the remainder at exit.
+buffered_file_handler = MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+buffered_file_handler.setLevel(logging.INFO)
+log_listener = QueueListener(log_queue, buffered_file_handler, stream_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Both accept %-style arguments so the message is only formatted if a
+# handler emits it; plain single-string calls from the services still work.
+def log_info(message, *args):
+    logging.info(message, *args)
+
+def log_error(message, *args, exc_info=False):
+    logging.error(message, *args, exc_info=exc_info)
 
 
 if getattr(sys, 'frozen', False):  # Running as PyInstaller exe
@@ -61,145 +61,196 @@ if getattr(sys, 'frozen', False):  # Running as PyInstaller exe
 else:
     os.environ["FLASK_ENV"] = "development"
 
-file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
-file_handler.setLevel(logging.INFO)
-file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.INFO)
-stream_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-logging.basicConfig(level=logging.INFO, handlers=[file_handler, stream_handler])
+
+SQLITE_HEADER = b"SQLite format 3\x00"
 
 def verify_sqlite_file(path):
+    # Checking the file header needs one read and no connection, journal or
+    # WAL setup; a missing, truncated or foreign file fails it.
     try:
-        conn = sqlite3.connect(path)
-        conn.execute("SELECT name FROM sqlite_master LIMIT 1;")
-        conn.close()
-        return True
-    except sqlite3.DatabaseError:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
         return False
 
-def force_close_sqlite_db(path):
-    gc.collect()
-    time.sleep(0.2)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+    "PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536;"
+)
+
+def _apply_sqlite_pragmas(conn):
+    # journal_mode=WAL is stored in the file, so later connections inherit it
+    conn.executescript(SQLITE_PRAGMAS)
+
+def _remove_sqlite_files(path):
+    # A WAL-mode database leaves -wal/-shm files beside it; a stale WAL must
+    # not be replayed onto the freshly created file.
+    for suffix in ("", "-wal", "-shm"):
+        target = path + suffix
+        # Windows can hold the file briefly after its last handle closes, so
+        # retry with short backoff rather than sleeping up front.
+        for delay in (0.01, 0.05, 0.2, None):
+            try:
+                if os.path.exists(target):
+                    os.remove(target)
+                break
+            except PermissionError:
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+# Schemas for freshly created databases, each applied as one transaction.
+_BIDDERS_SCHEMA = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS schema_version (
+    version TEXT PRIMARY KEY
+);
+INSERT OR IGNORE INTO schema_version (version) VALUES ('1.0');
+CREATE TABLE IF NOT EXISTS bidders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT,
+    username TEXT NOT NULL,
+    original_username TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    weight TEXT,
+    is_giveaway INTEGER NOT NULL,
+    bin_number INTEGER,
+    giveaway_number INTEGER,
+    timestamp TEXT NOT NULL,
+    last_assigned TEXT,
+    first_name TEXT,
+    auction_id TEXT,
+    UNIQUE(username, timestamp)
+);
+CREATE TABLE IF NOT EXISTS bin_assignments (
+    username TEXT PRIMARY KEY,
+    bin_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS shows (
+    show_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT,
+    start_time TEXT NOT NULL,
+    end_time TEXT
+);
+COMMIT;
+"""
 
 def create_blank_bidders_db(path):
     try:
-        if os.path.exists(path):
-            os.remove(path)
+        _remove_sqlite_files(path)
     except Exception as e:
-        log_error(f"Failed to delete corrupted bidders_qt.db: {e}")
+        log_error("Failed to delete corrupted bidders_qt.db: %s", e)
     with sqlite3.connect(path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS schema_version (
-                version TEXT PRIMARY KEY
-            );
-        """)
-        cursor.execute("INSERT OR IGNORE INTO schema_version (version) VALUES ('1.0');")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bidders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT,
-                username TEXT NOT NULL,
-                original_username TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                weight TEXT,
-                is_giveaway INTEGER NOT NULL,
-                bin_number INTEGER,
-                giveaway_number INTEGER,
-                timestamp TEXT NOT NULL,
-                last_assigned TEXT,
-                first_name TEXT,
-                auction_id TEXT,
-                UNIQUE(username, timestamp)
-            );
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bin_assignments (
-                username TEXT PRIMARY KEY,
-                bin_number INTEGER NOT NULL
-            );
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS shows (
-                show_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT,
-                start_time TEXT NOT NULL,
-                end_time TEXT
-            );
-        """)
-        conn.commit()
-        log_info(f"Blank bidders_qt.db created at {path}")
+        _apply_sqlite_pragmas(conn)
+        conn.executescript(_BIDDERS_SCHEMA)
+        log_info("Blank bidders_qt.db created at %s", path)
+
+_SUBSCRIPTIONS_SCHEMA = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS schema_version (
+    version TEXT PRIMARY KEY
+);
+INSERT OR IGNORE INTO schema_version (version) VALUES ('1.0');
+CREATE TABLE IF NOT EXISTS subscriptions (
+    email TEXT PRIMARY KEY,
+    tier TEXT NOT NULL,
+    license_key TEXT
+);
+CREATE TABLE IF NOT EXISTS settings (
+    email TEXT PRIMARY KEY,
+    chat_id TEXT,
+    top_buyer_text TEXT,
+    giveaway_announcement_text TEXT,
+    flash_sale_announcement_text TEXT,
+    multi_buyer_mode BOOLEAN,
+    FOREIGN KEY (email) REFERENCES subscriptions(email)
+);
+CREATE TABLE IF NOT EXISTS installs (
+    hashed_email TEXT PRIMARY KEY,
+    install_id TEXT NOT NULL,
+    tier TEXT NOT NULL DEFAULT 'Trial'
+);
+COMMIT;
+"""
 
 def create_blank_subscriptions_db(path):
     try:
-        if os.path.exists(path):
-            os.remove(path)
+        _remove_sqlite_files(path)
     except Exception as e:
-        log_error(f"Failed to delete corrupted subscriptions_qt.db: {e}")
+        log_error("Failed to delete corrupted subscriptions_qt.db: %s", e)
     with sqlite3.connect(path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS schema_version (
-                version TEXT PRIMARY KEY
-            );
-        """)
-        cursor.execute("INSERT OR IGNORE INTO schema_version (version) VALUES ('1.0');")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS subscriptions (
-                email TEXT PRIMARY KEY,
-                tier TEXT NOT NULL,
-                license_key TEXT
-            );
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                email TEXT PRIMARY KEY,
-                chat_id TEXT,
-                top_buyer_text TEXT,
-                giveaway_announcement_text TEXT,
-                flash_sale_announcement_text TEXT,
-                multi_buyer_mode BOOLEAN,
-                FOREIGN KEY (email) REFERENCES subscriptions(email)
-            );
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS installs (
-                hashed_email TEXT PRIMARY KEY,
-                install_id TEXT NOT NULL,
-                tier TEXT NOT NULL DEFAULT 'Trial'
-            );
-        """)
-        conn.commit()
-        log_info(f"Blank subscriptions_qt.db created at {path}")
-
-def check_port(port):
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind(("0.0.0.0", port))
-            return True
-        except OSError:
-            return False
+        _apply_sqlite_pragmas(conn)
+        conn.executescript(_SUBSCRIPTIONS_SCHEMA)
+        log_info("Blank subscriptions_qt.db created at %s", path)
+
+def _verify_or_create(path, create_blank):
+    if not os.path.exists(path) or not verify_sqlite_file(path):
+        create_blank(path)
 
 def find_open_port(start_port=8000, max_attempts=10):
+    """Return ``(port, sock)``; the socket stays bound so the server can adopt it."""
+    # One socket for every candidate: a failed bind leaves it unbound, so it
+    # can simply be retried on the next port.
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # On Windows SO_REUSEADDR would let us share a port already in use
+    if os.name != "nt":
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     for port in range(start_port, start_port + max_attempts):
-        if check_port(port):
-            return port
+        try:
+            s.bind(("0.0.0.0", port))
+            return port, s
+        except OSError:
+            continue
+    s.close()
     raise RuntimeError("No available ports found")
 
-def wait_for_server(url, timeout=30):
+def wait_for_server(url, timeout=30, ready_event=None):
     start = time.time()
+    # Block until the server reports it is listening instead of polling blind;
+    # the health check below then normally passes on its first request.
+    if ready_event is not None and not ready_event.wait(timeout):
+        raise RuntimeError("Flask server did not start in time")
+    import requests
+    from requests.adapters import HTTPAdapter
+    # Probe with a bare TCP connect until the port accepts; the HTTP request
+    # is only worth making once something is listening.
+    parts = urlsplit(url)
+    address = (parts.hostname, parts.port)
     while time.time() - start < timeout:
         try:
-            if requests.get(url, timeout=5).status_code == 200:
-                log_info("Flask server health check passed")
-                return True
-        except requests.RequestException:
-            pass
-        time.sleep(0.5)
+            socket.create_connection(address, timeout=0.05).close()
+            break
+        except OSError:
+            time.sleep(0.02)
+    # HEAD over one kept-alive connection; retries back off from 20 ms to
+    # 200 ms since the server is local and usually already up.
+    delay = 0.02
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        while time.time() - start < timeout:
+            try:
+                if session.head(url, timeout=(0.2, 0.5)).status_code == 200:
+                    log_info("Flask server health check passed")
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.2)
     raise RuntimeError("Flask server did not start in time")
 
 def main():
+    # Qt and the app modules are imported here rather than at module level so
+    # importing main_qt (and the path/logging/port setup above) stays cheap.
+    from PySide6.QtWidgets import QApplication, QInputDialog, QMessageBox
+    from cloud_database_qt import CloudDatabaseManager
+    from telegram_qt import TelegramService
+    from bidder_manager_qt import BidderManager
+    from flask_server_qt import FlaskServer
+    from gui_qt import SwiftSaleGUI
+    from stripe_service_qt import StripeService
+    from mailing_list_manager import close_all_connections as close_mailing_list_connections
+
+    app = QApplication.instance() or QApplication(sys.argv)
     log_info("Starting SwiftSale GUI")
     install_info = get_or_create_install_info()
     user_email = install_info.get("email", "trial@swiftsaleapp.com")
@@ -207,48 +258,46 @@ def main():
 
     # Prompt for real email if still using default trial email
     if user_email == "trial@swiftsaleapp.com":
-        from PySide6.QtWidgets import QInputDialog
         email, ok = QInputDialog.getText(None, "Enter Your Email", "Please enter your SwiftSale email:")
         if ok and email:
             user_email = email.strip().lower()
             install_info["email"] = user_email
             save_install_info(user_email, install_info.get("install_id"), install_info.get("tier"))
-            log_info(f"User email set to: {user_email}")
+            log_info("User email set to: %s", user_email)
 
             # Auto-update installs table with hashed_email -> tier mapping
             try:
                 # Enforce 2-device limit
                 if os.getenv("FLASK_ENV") == "production":
                     import hashlib
-                    from PySide6.QtWidgets import QMessageBox
-                    from cloud_database_qt import CloudDatabaseManager
 
                     hashed_email = hashlib.sha256(user_email.strip().lower().encode()).hexdigest()
                     cloud_db_tmp = CloudDatabaseManager(log_info=log_info, log_error=log_error)
 
                     with cloud_db_tmp.pool.connection() as conn:
                         with conn.cursor() as cur:
+                            # Existence check, device count and insert in one round trip
                             cur.execute("""
-                                SELECT 1 FROM install_devices
-                                WHERE hashed_email = %s AND device_id = %s
-                            """, (hashed_email, device_id))
-                            if cur.fetchone():
-                                log_info(f"Device {device_id} already registered for {user_email}")
+                                WITH existing AS (
+                                    SELECT 1 FROM install_devices
+                                    WHERE hashed_email = %(hashed_email)s AND device_id = %(device_id)s
+                                ), inserted AS (
+                                    INSERT INTO install_devices (raw_email, hashed_email, device_id)
+                                    SELECT %(raw_email)s, %(hashed_email)s, %(device_id)s
+                                    WHERE NOT EXISTS (SELECT 1 FROM existing)
+                                      AND (SELECT COUNT(*) FROM install_devices WHERE hashed_email = %(hashed_email)s) < 2
+                                    RETURNING 1
+                                )
+                                SELECT EXISTS (SELECT 1 FROM existing), EXISTS (SELECT 1 FROM inserted)
+                            """, {"raw_email": user_email, "hashed_email": hashed_email, "device_id": device_id})
+                            already_registered, registered = cur.fetchone()
+                            if already_registered:
+                                log_info("Device %s already registered for %s", device_id, user_email)
+                            elif registered:
+                                log_info("Registered device %s for %s", device_id, user_email)
                             else:
-                                cur.execute("""
-                                    SELECT COUNT(*) FROM install_devices
-                                    WHERE hashed_email = %s
-                                """, (hashed_email,))
-                                count = cur.fetchone()[0]
-                                if count < 2:
-                                    cur.execute("""
-                                        INSERT INTO install_devices (raw_email, hashed_email, device_id)
-                                        VALUES (%s, %s, %s)
-                                    """, (user_email, hashed_email, device_id))
-                                    log_info(f"Registered device {device_id} for {user_email}")
-                                else:
-                                    QMessageBox.critical(None, "Access Denied", f"{user_email} is already signed in on 2 devices.")
-                                    sys.exit(1)
+                                QMessageBox.critical(None, "Access Denied", f"{user_email} is already signed in on 2 devices.")
+                                sys.exit(1)
                     cloud_db_tmp.close()
             except Exception as e:
                 QMessageBox.critical(None, "Database Error", f"Device limit check failed:\n{e}")
@@ -257,19 +306,21 @@ def main():
             
     config = load_config()
     redacted = {k: ("<REDACTED>" if any(x in k for x in ["KEY", "TOKEN", "SECRET"]) else v) for k, v in config.items()}
-    log_info(f"Loaded config: {redacted}")
+    log_info("Loaded config: %s", redacted)
 
-    port = find_open_port(int(config.get("PORT", 8000)))
+    port, server_socket = find_open_port(int(config.get("PORT", 8000)))
     config["PORT"] = str(port)
     config["APP_BASE_URL"] = f"http://localhost:{port}"
 
-    # Initialize database paths
-    if not os.path.exists(bidders_db_path) or not verify_sqlite_file(bidders_db_path):
-        force_close_sqlite_db(bidders_db_path)
-        create_blank_bidders_db(bidders_db_path)
-    if not os.path.exists(subs_db_path) or not verify_sqlite_file(subs_db_path):
-        force_close_sqlite_db(subs_db_path)
-        create_blank_subscriptions_db(subs_db_path)
+    # Initialize database paths; the two files are independent, so their
+    # checks (and any rebuild fsyncs) overlap.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_verify_or_create, bidders_db_path, create_blank_bidders_db),
+            executor.submit(_verify_or_create, subs_db_path, create_blank_subscriptions_db),
+        ]
+        for future in futures:
+            future.result()
 
     bidder_manager = BidderManager(
         bidders_db_path=bidders_db_path,
@@ -293,14 +344,15 @@ def main():
     )
 
     def latest_bin_callback(bin_info):
-        log_info(f"Latest bin callback received: {bin_info}")
+        log_info("Latest bin callback received: %s", bin_info)
 
+    # The cloud pool connects in the background while the Flask server starts
     cloud_db = None
+    cloud_db_future = None
     if os.getenv("FLASK_ENV", "development") == "production":
-        try:
-            cloud_db = CloudDatabaseManager(log_info=log_info, log_error=log_error)
-        except Exception as e:
-            log_error(f"Failed to initialize CloudDatabaseManager: {e}", exc_info=True)
+        executor = ThreadPoolExecutor(max_workers=1)
+        cloud_db_future = executor.submit(CloudDatabaseManager, log_info=log_info, log_error=log_error)
+        executor.shutdown(wait=False)
 
     flask_server = FlaskServer(
         port=port,
@@ -312,10 +364,17 @@ def main():
         log_error=log_error,
         user_data_dir=user_data_dir,
         bidder_manager=bidder_manager,
-        telegram_service=telegram_service
+        telegram_service=telegram_service,
+        sock=server_socket
     )
     threading.Thread(target=flask_server.start, daemon=True).start()
-    wait_for_server(f"http://localhost:{port}/health")
+    wait_for_server(f"http://localhost:{port}/health", ready_event=flask_server.ready)
+
+    if cloud_db_future is not None:
+        try:
+            cloud_db = cloud_db_future.result()
+        except Exception as e:
+            log_error("Failed to initialize CloudDatabaseManager: %s", e, exc_info=True)
  
     gui = SwiftSaleGUI(
         stripe_service=stripe_service,  # Pass stripe_service instead of None
@@ -343,10 +402,10 @@ def main():
             tier = bidder_manager.get_tier_for_user(user_email)
             install_info["tier"] = tier
             save_install_info(user_email, install_info.get("install_id"), tier)
-            log_info(f"[SYNC] Synced and saved cloud tier '{tier}' for {user_email}")
+            log_info("[SYNC] Synced and saved cloud tier '%s' for %s", tier, user_email)
             gui.show_toast(f"✔ License Verified – {tier} Tier")
         except Exception as e:
-            log_error(f"Cloud sync failed for {user_email}: {e}")
+            log_error("Cloud sync failed for %s: %s", user_email, e)
 
     gui.show()
 
@@ -357,8 +416,9 @@ def main():
             telegram_service.close()
             flask_server.shutdown()
             bidder_manager.close()
+            close_mailing_list_connections()
         except Exception as e:
-            log_error(f"Error during shutdown: {e}")
+            log_error("Error during shutdown: %s", e)
         app.quit()
 
     gui.closeEvent = lambda event: [on_closing(), event.accept()]
@@ -1,35 +1,36 @@
 import re
 from datetime import datetime
+from itertools import islice
+
+# Patterns used on every packing-slip page, compiled once.
+# First line not mentioning "new buyer" that holds "Name (username)"; the
+# address starts right after it.
+_ADDR_START_RE = re.compile(
+    r"^(?!.*(?i:new buyer))(?P<name>.+?)[^\S\n]*\((?P<user>[^)\n]+)\)", re.MULTILINE
+)
+# One punctuation-delimited address part.
+_ADDR_PART_RE = re.compile(r"[^.,]+")
+_ADDR2_RE = re.compile(r"^(ste|apt|unit|fl|#)?\s?\d+[a-zA-Z]?$", re.IGNORECASE)
+_SUBTOTAL_RE = re.compile(r"Subtotal:\s*\$([0-9]+\.[0-9]{2})", re.IGNORECASE)
 
 def parse_packing_slip_address(page_text: str):
-    lines = [line.strip() for line in page_text.splitlines() if line.strip()]
-
-    start_index = None
-    full_name = username = None
-
-    # Step 1: Find the line with (username) — the start of address
-    for i, line in enumerate(lines):
-        if "new buyer" in line.lower():
-            continue
-        match = re.search(r"(.+?)\s*\(([^)]+)\)", line)
-        if match:
-            full_name = match.group(1).strip()
-            username = match.group(2).strip()
-            start_index = i
-            break
+    text = "\n".join(line.strip() for line in page_text.splitlines() if line.strip())
 
-    if start_index is None or not full_name or not username:
+    # Step 1: Find the first "Name (username)" line — the start of address
+    match = _ADDR_START_RE.search(text)
+    full_name = match.group("name").strip() if match else None
+    username = match.group("user").strip() if match else None
+    if not full_name or not username:
         print("[DEBUG] Could not locate username/address starting line.")
         return None
 
-    # Step 2: Join all lines from that point forward as address block
-    address_block = " ".join(lines[start_index:])
-
-    # Step 3: Extract the text AFTER the (username) for parsing
-    after_username = re.split(r"\([^)]+\)", address_block, maxsplit=1)[-1].strip()
-
-    # Step 4: Split address block into parts using punctuation
-    parts = [p.strip() for p in re.split(r"[.,]", after_username) if p.strip()]
+    # Steps 2-4: Everything after the (username) is the address block, split
+    # into parts on punctuation with line breaks read as spaces.  At most six
+    # parts are used, so the rest of the page is never tokenised.
+    parts = list(islice(
+        filter(None, (m.group().strip().replace("\n", " ") for m in _ADDR_PART_RE.finditer(text, match.end()))),
+        6,
+    ))
     if len(parts) < 4:
         print(f"[DEBUG] Not enough parts in address: {parts}")
         return None
@@ -39,7 +40,7 @@ def parse_packing_slip_address(page_text: str):
     known_keywords = ("ste", "apt", "unit", "fl", "bldg", "#")
     is_address_2 = (
         second.lower().startswith(known_keywords) or
-        re.match(r"^(ste|apt|unit|fl|#)?\s?\d+[a-zA-Z]?$", second, re.IGNORECASE) or
+        _ADDR2_RE.match(second) or
         (second.isupper() and len(second.split()) <= 3)
     )
 
@@ -69,18 +70,12 @@ def parse_packing_slip_address(page_text: str):
         "country": country.upper()
     }
 
-
-import re
-
 def extract_spent_amount(page_text: str) -> float:
     """
     Sums all 'Subtotal: $X.XX' values from a page, ensuring accurate totals
     for both pickup and shipping labels.
     """
-    pattern = r"(?i)Subtotal:\s*\$([0-9]+\.[0-9]{2})"
-    matches = re.findall(pattern, page_text)
-
-    return sum(float(m) for m in matches)
+    return sum(map(float, _SUBTOTAL_RE.findall(page_text)))
 
 
 
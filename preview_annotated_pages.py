@@ -1,9 +1,27 @@
 import tempfile
 import os
+import re
+import sqlite3
 import webbrowser
+from pathlib import Path
 from PyPDF2 import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
 
+# Any line that starts with "pickup", ignoring leading whitespace and case.
+_PICKUP_LINE_RE = re.compile(r"^\s*pickup", re.IGNORECASE | re.MULTILINE)
+
+# db_path -> read-only connection reused across previews.
+_BIN_CONN_CACHE = {}
+
+def _get_ro_conn(db_path):
+    conn = _BIN_CONN_CACHE.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(
+            Path(db_path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+        _BIN_CONN_CACHE[db_path] = conn
+    return conn
+
 def preview_annotated_pages(pdf_path, db_path, stamp_x, stamp_y):
     """
     Generates a temporary PDF with a sample shipping and pickup page
@@ -17,38 +35,48 @@ def preview_annotated_pages(pdf_path, db_path, stamp_x, stamp_y):
     font_size_first = 14
     font_size_default = 10
 
-    import pdfplumber
-    import sqlite3
     import io
+    from annotate_labels_qt import extract_username_and_pickup_firstname
 
     preview_writer = PdfWriter()
     shipping_done = pickup_done = False
 
-    # Load bin assignments
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT username, bin_number FROM bin_assignments;")
-    bin_map = {row[0].strip().lower(): row[1] for row in cursor.fetchall()}
-    conn.close()
+    # Load bin assignments.  Both writers store usernames already stripped and
+    # lowercased, so the rows map straight into a dict.
+    bin_map = dict(_get_ro_conn(db_path).execute("SELECT username, bin_number FROM bin_assignments;"))
+
+    # PyPDF2 both extracts the text and supplies the pages to stamp, so the
+    # file is parsed once and only up to the last page previewed.
+    pdf_reader = PdfReader(pdf_path)
+    # (page, bin_number, is_pickup, first_name) for each sample page
+    samples = []
+    for original_page in pdf_reader.pages:
+        page_text = original_page.extract_text() or ""
+        is_pickup = _PICKUP_LINE_RE.search(page_text) is not None
+
+        if (is_pickup and pickup_done) or (not is_pickup and shipping_done):
+            continue  # skip if already previewed
 
-    with pdfplumber.open(pdf_path) as plumber_pdf:
-        pdf_reader = PdfReader(pdf_path)
+        username, first_name = extract_username_and_pickup_firstname(page_text)
+        if not username:
+            continue
 
-        for i, page in enumerate(plumber_pdf.pages):
-            page_text = page.extract_text() or ""
-            username, first_name = extract_username_and_pickup_firstname(page_text)
-            if not username:
-                continue
+        samples.append((original_page, bin_map.get(username.lower()), is_pickup, first_name))
 
-            bin_number = bin_map.get(username.lower())
-            is_pickup = any(line.lower().strip().startswith("pickup") for line in page_text.splitlines())
+        if is_pickup:
+            pickup_done = True
+        else:
+            shipping_done = True
 
-            if (is_pickup and pickup_done) or (not is_pickup and shipping_done):
-                continue  # skip if already previewed
+        if pickup_done and shipping_done:
+            break
 
-            original_page = pdf_reader.pages[i]
-            packet = io.BytesIO()
-            can = canvas.Canvas(packet, pagesize=PAGE_SIZE)
+    if samples:
+        # Draw every overlay on one canvas, one page each, and parse the
+        # result once instead of building a canvas and reader per page.
+        packet = io.BytesIO()
+        can = canvas.Canvas(packet, pagesize=PAGE_SIZE)
+        for _, bin_number, is_pickup, first_name in samples:
             can.setFont(font_name, font_size_app)
             can.drawString(stamp_x, stamp_y + font_size_bin + 4, "SwiftSale App:")
 
@@ -62,22 +90,14 @@ def preview_annotated_pages(pdf_path, db_path, stamp_x, stamp_y):
                 can.setFont(font_name, font_size_default)
                 can.drawString(stamp_x, stamp_y, "Possible")
                 can.drawString(stamp_x, stamp_y - font_size_default, "(Givvy/FlashSale)")
-
-            can.save()
-            packet.seek(0)
-            overlay_pdf = PdfReader(packet)
-            overlay_page = overlay_pdf.pages[0]
+            can.showPage()
+        can.save()
+        packet.seek(0)
+        overlay_pdf = PdfReader(packet)
+        for (original_page, *_), overlay_page in zip(samples, overlay_pdf.pages):
             original_page.merge_page(overlay_page)
             preview_writer.add_page(original_page)
 
-            if is_pickup:
-                pickup_done = True
-            else:
-                shipping_done = True
-
-            if pickup_done and shipping_done:
-                break
-
     # Write to temp file and open
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
         preview_writer.write(tmp_file)
@@ -1,8 +1,25 @@
 import stripe
 import logging
 import hashlib
+import re
+import threading
+from functools import lru_cache
 from config_qt import PRICE_MAP, REVERSE_PRICE_MAP, TIER_LIMITS
 
+# Caps in-flight Stripe API requests across the waitress workers and GUI
+# pool threads so a burst cannot run into Stripe's rate limit.
+_STRIPE_MAX_IN_FLIGHT = 4
+_stripe_in_flight = threading.BoundedSemaphore(_STRIPE_MAX_IN_FLIGHT)
+
+# local@domain.tld with at least one dot in the domain.  Each label class
+# excludes its separator, so matching never backtracks across them.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s.]+(?:\.[^@\s.]+)+")
+_EMAIL_MAX_LENGTH = 254
+
+@lru_cache(maxsize=4096)
+def _hash_email(email_lower):
+    return hashlib.sha256(email_lower.encode()).hexdigest()
+
 class StripeService:
     def __init__(self, stripe_secret_key, webhook_secret, db_manager, api_token, env="development"):
         stripe.api_key = stripe_secret_key
@@ -15,10 +32,11 @@ class StripeService:
         logging.info("StripeService initialized with env: %s", env)
 
     def hash_email(self, email):
-        return hashlib.sha256(email.lower().encode()).hexdigest()
+        # Lowercase before the lookup so case variants share one cache entry
+        return _hash_email(email.lower())
 
     def create_checkout_session(self, tier, user_email, request_url_root):
-        if not user_email or "@" not in user_email:
+        if not user_email or len(user_email) > _EMAIL_MAX_LENGTH or not _EMAIL_RE.fullmatch(user_email):
             logging.error(f"Invalid email: {user_email}")
             return {"error": "Invalid email address."}, 400
 
@@ -31,15 +49,16 @@ class StripeService:
             if not price_id:
                 return {"error": f"No price configured for tier '{tier}'"}, 400
 
-            session = stripe.checkout.Session.create(
-                success_url=request_url_root + 'success',
-                cancel_url=request_url_root + 'cancel',
-                payment_method_types=["card"],
-                mode="subscription",
-                customer_email=user_email,
-                line_items=[{"price": price_id, "quantity": 1}],
-                metadata={"user_email": user_email},
-            )
+            with _stripe_in_flight:
+                session = stripe.checkout.Session.create(
+                    success_url=request_url_root + 'success',
+                    cancel_url=request_url_root + 'cancel',
+                    payment_method_types=["card"],
+                    mode="subscription",
+                    customer_email=user_email,
+                    line_items=[{"price": price_id, "quantity": 1}],
+                    metadata={"user_email": user_email},
+                )
             logging.info(f"Stripe Checkout session created for {user_email} -> {tier}")
             return {"url": session.url}, 200
 
@@ -49,22 +68,18 @@ class StripeService:
 
     def upgrade_subscription(self, user_email, new_tier, license_key):
         if license_key == "DEV_MODE":
-            self.db_manager.update_subscription(user_email, new_tier, "DEV_MODE")
-            hashed_email = self.hash_email(user_email)
-            install = self.db_manager.get_install_by_hashed_email(hashed_email)
-            if install:
-                self.db_manager.update_install_tier(hashed_email, new_tier)
+            if self.db_manager.apply_tier_change(
+                user_email, self.hash_email(user_email), new_tier, new_tier, "DEV_MODE"
+            ):
                 logging.info(f"(dev) Install upgraded to {new_tier} for {user_email}")
             return True
         return False
 
     def cancel_subscription(self, user_email, license_key):
         if license_key == "DEV_MODE":
-            self.db_manager.update_subscription(user_email, "Trial", "")
-            hashed_email = self.hash_email(user_email)
-            install = self.db_manager.get_install_by_hashed_email(hashed_email)
-            if install:
-                self.db_manager.update_install_tier(hashed_email, "free")
+            if self.db_manager.apply_tier_change(
+                user_email, self.hash_email(user_email), "Trial", "free", ""
+            ):
                 logging.info(f"(dev) Subscription cancelled for {user_email}")
             return True
         return False
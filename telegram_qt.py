@@ -1,9 +1,30 @@
 import logging
 import asyncio
+import threading
 from datetime import datetime, timezone
 from telegram import Bot
 from telegram.error import TelegramError
 
+# Bin notifications for one chat are collected for this long and sent as a
+# single message, keeping bursts under Telegram's per-chat rate limit.
+BATCH_WINDOW_SECONDS = 1.0
+# Telegram rejects longer message texts.
+MAX_MESSAGE_LENGTH = 4096
+
+def _chunk_lines(lines, limit):
+    """Join lines with newlines into as few texts of at most ``limit`` chars as possible."""
+    chunk = []
+    size = 0
+    for line in lines:
+        if chunk and size + 1 + len(line) > limit:
+            yield "\n".join(chunk)
+            chunk = []
+            size = 0
+        size += len(line) + (1 if chunk else 0)
+        chunk.append(line)
+    if chunk:
+        yield "\n".join(chunk)
+
 class TelegramService:
     def __init__(self, bot_token, chat_id=None, log_info=None, log_warning=None, log_error=None, loop=None):
         """
@@ -21,8 +42,19 @@ class TelegramService:
         self.log_info = log_info or logging.info
         self.log_warning = log_warning or logging.warning 
         self.log_error = log_error or logging.error
-        self.loop = loop or asyncio.new_event_loop()  # Create new loop if none provided
         self.error_shown = set()  # Track specific errors to avoid spamming
+        self._pending = {}  # chat_id -> (message lines, future for the batch)
+        self._loop_thread = None
+        if loop is not None:
+            self.loop = loop  # Driven by the caller
+        else:
+            # Own loop, driven by one long-lived daemon thread so futures from
+            # run_async actually complete.
+            self.loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self.loop.run_forever, name="TelegramServiceLoop", daemon=True
+            )
+            self._loop_thread.start()
 
         if not bot_token:
             self.log_warning("Telegram bot token not found. Telegram features disabled.")
@@ -47,6 +79,9 @@ class TelegramService:
             
         Returns:
             bool: True if message sent successfully, False otherwise.
+
+        Notifications for the same chat that arrive within
+        ``BATCH_WINDOW_SECONDS`` are sent together as one message.
         """
         if not self.bot:
             self.log_warning("Cannot send Telegram message: Bot not initialized")
@@ -56,27 +91,42 @@ class TelegramService:
             self.log_warning("Cannot send Telegram message: Chat ID missing")
             return False
 
+        message = f"Username: {username} | Bin: {bin_number}"
+        if auction_id:
+            message += f" | Auction: {auction_id}"
+        message += f" | Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+
+        # Join the chat's open batch, or open one that flushes after the window
+        batch = self._pending.get(target_chat_id)
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            batch = self._pending[target_chat_id] = ([], loop.create_future())
+            loop.call_later(BATCH_WINDOW_SECONDS, lambda: loop.create_task(self._flush(target_chat_id)))
+        batch[0].append(message)
+        return await asyncio.shield(batch[1])
+
+    async def _flush(self, chat_id):
+        """Send one chat's batched notifications and resolve its waiters."""
+        lines, done = self._pending.pop(chat_id)
+        sent = True
         try:
-            message = f"Username: {username} | Bin: {bin_number}"
-            if auction_id:
-                message += f" | Auction: {auction_id}"
-            message += f" | Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-            await self.bot.send_message(chat_id=target_chat_id, text=message)
-            self.log_info(f"Sent Telegram message: {message}")
+            for text in _chunk_lines(lines, MAX_MESSAGE_LENGTH):
+                await self.bot.send_message(chat_id=chat_id, text=text)
+            self.log_info(f"Sent Telegram message with {len(lines)} bin notification(s)")
             self.error_shown.discard("send_message_failure")  # Reset error suppression
-            return True
         except TelegramError as e:
+            sent = False
             error_key = "send_message_failure"
             if error_key not in self.error_shown:
                 self.log_error(f"Failed to send Telegram message: {e}", exc_info=True)
                 self.error_shown.add(error_key)
-            return False
         except Exception as e:
+            sent = False
             error_key = f"unexpected_{str(e)[:50]}"
             if error_key not in self.error_shown:
                 self.log_error(f"Unexpected error sending Telegram message: {e}", exc_info=True)
                 self.error_shown.add(error_key)
-            return False
+        done.set_result(sent)
 
     def run_async(self, coro):
         """
@@ -88,10 +138,11 @@ class TelegramService:
         Returns:
             asyncio.Future: Future object for the coroutine, or None if loop unavailable.
         """
+        if self.loop.is_closed():
+            self.log_error("Cannot run Telegram coroutine: TelegramService is closed")
+            coro.close()
+            return None
         try:
-            if self.loop.is_closed():
-                self.loop = asyncio.new_event_loop()
-                self.log_info("Created new asyncio event loop for TelegramService")
             return asyncio.run_coroutine_threadsafe(coro, self.loop)
         except Exception as e:
             self.log_error(f"Failed to run async coroutine: {e}", exc_info=True)
@@ -99,8 +150,13 @@ class TelegramService:
 
     def close(self):
         """
-        Close the asyncio event loop.
+        Stop the event loop thread (if this service owns it) and close the loop.
         """
-        if self.loop and not self.loop.is_closed():
+        if self._loop_thread is not None:
+            if not self.loop.is_closed():
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join(timeout=2)
+            self._loop_thread = None
+        if self.loop and not self.loop.is_closed() and not self.loop.is_running():
             self.loop.close()
             self.log_info("Closed TelegramService asyncio event loop")
\ No newline at end of file
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def mailing_db(tmp_path):
+    pytest.importorskip("PySide6")
+    pytest.importorskip("reportlab")
+    from mailing_list_manager import MailingListManager
+
+    db = MailingListManager(str(tmp_path / "mailing_list.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+    # Tear widgets down while Qt is still alive, not during interpreter exit
+    for widget in app.topLevelWidgets():
+        widget.deleteLater()
+    app.processEvents()
@@ -0,0 +1,135 @@
+import sqlite3
+
+import pytest
+
+
+def _entry(i, state="TX"):
+    return {
+        "full_name": f"Buyer {i:04d}",
+        "username": f"user{i}",
+        "email": f"buyer{i}@example.com",
+        "address_line_1": f"{i} Main St",
+        "address_line_2": "",
+        "city": "Austin",
+        "state": state,
+        "zip_code": "78701",
+        "spent": float(i),
+    }
+
+
+def test_viewer_pages_through_entries(mailing_db, qapp):
+    from mailing_list_manager import MailingListViewer
+
+    page_size = MailingListViewer.PAGE_SIZE
+    mailing_db.add_or_update_entries(_entry(i) for i in range(page_size + 5))
+    viewer = MailingListViewer(db=mailing_db)
+
+    assert viewer.table.rowCount() == page_size
+    assert not viewer.prev_button.isEnabled()
+    assert viewer.next_button.isEnabled()
+    # Pages are ordered by spent, highest first
+    assert viewer.table.item(0, 1).text() == f"Buyer {page_size + 4:04d}"
+
+    viewer.next_button.click()
+    assert viewer._offset == page_size
+    assert viewer.table.rowCount() == 5
+    assert viewer.prev_button.isEnabled()
+    assert not viewer.next_button.isEnabled()
+    assert viewer.table.item(4, 1).text() == "Buyer 0000"
+
+    viewer.prev_button.click()
+    assert viewer._offset == 0
+    assert viewer.table.rowCount() == page_size
+    assert viewer.next_button.isEnabled()
+
+
+def test_select_all_covers_every_page_of_the_search(mailing_db, qapp):
+    from mailing_list_manager import MailingListViewer
+
+    page_size = MailingListViewer.PAGE_SIZE
+    mailing_db.add_or_update_entries(_entry(i) for i in range(page_size + 5))
+    mailing_db.add_or_update_entries(_entry(i, state="CA") for i in range(page_size + 5, page_size + 8))
+    viewer = MailingListViewer(db=mailing_db)
+    viewer.load_data({"state": "TX"})
+
+    viewer.select_all_rows()
+    assert mailing_db.get_match_counts({"state": "TX"}) == (page_size + 5, page_size + 5)
+    assert mailing_db.get_match_counts({"state": "CA"}) == (3, 0)
+
+    viewer.select_all_rows()
+    assert mailing_db.get_checked_ids() == []
+
+
+_BASELINE_SCHEMA = """
+    CREATE TABLE mailing_list (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        full_name TEXT,
+        username TEXT,
+        email TEXT,
+        address_line_1 TEXT,
+        address_line_2 TEXT,
+        city TEXT,
+        state TEXT,
+        zip_code TEXT,
+        order_date TEXT,
+        order_id TEXT,
+        num_orders INTEGER DEFAULT 1,
+        spent REAL DEFAULT 0.0,
+        checked INTEGER DEFAULT 0
+    )
+"""
+
+
+def test_migration_merges_duplicates_into_oldest_row(tmp_path):
+    pytest.importorskip("PySide6")
+    pytest.importorskip("reportlab")
+    from mailing_list_manager import MailingListManager
+
+    db_path = str(tmp_path / "baseline.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(_BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO mailing_list (full_name, address_line_1, city, state, zip_code, spent, checked)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("Ann", "1 Main St", "Austin", "TX", "78701", 10.0, 0),
+            ("Ann", "1 Main St", "Austin", "TX", "78701", 25.0, 1),
+            ("Ann", "1 Main St", "Austin", "TX", "78701", 5.0, 0),
+            ("Bob", None, "Austin", "TX", "78701", 1.0, 0),
+            ("Bob", None, "Austin", "TX", "78701", 2.0, 1),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    db = MailingListManager(db_path)
+    try:
+        rows = [tuple(r) for r in db._conn.execute(
+            "SELECT id, full_name, spent, checked FROM mailing_list ORDER BY id"
+        )]
+    finally:
+        db.close()
+
+    # The oldest Ann survives with the highest spent and the checked flag;
+    # Bob's rows never clashed under the unique index (NULL address), so both stay
+    assert rows == [(1, "Ann", 25.0, 1), (4, "Bob", 1.0, 0), (5, "Bob", 2.0, 1)]
+
+
+def test_iter_entries_streams_without_holding_the_shared_lock(mailing_db):
+    from mailing_list_manager import _ITER_FETCH_SIZE
+
+    mailing_db.add_or_update_entries(_entry(i) for i in range(_ITER_FETCH_SIZE + 10))
+    rows = mailing_db.iter_entries(sort_by_spent=True)
+    first = next(rows)
+    assert first["full_name"] == f"Buyer {_ITER_FETCH_SIZE + 9:04d}"
+
+    # Writes through the shared connection proceed mid-iteration and stay
+    # invisible to the iterator's snapshot
+    assert mailing_db._lock.acquire(timeout=1)
+    mailing_db._lock.release()
+    mailing_db.add_or_update_entries([_entry(_ITER_FETCH_SIZE + 50)])
+
+    remaining = list(rows)
+    assert len(remaining) == _ITER_FETCH_SIZE + 9
+    assert remaining[-1]["full_name"] == "Buyer 0000"
+    assert len(mailing_db.get_all_entries()) == _ITER_FETCH_SIZE + 11
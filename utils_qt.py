@@ -1,59 +1,190 @@
-from PySide6.QtWidgets import QGraphicsOpacityEffect
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QPixmap, QFont, QCursor
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QWidget
+from PySide6.QtCore import Qt, QPoint, QTimer, QPropertyAnimation, QEasingCurve, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QFont, QFontMetrics, QCursor
+
+TOAST_ICON_SIZE = 24
+_TOAST_PADDING_X = 12
+_TOAST_PADDING_Y = 10
+_TOAST_SPACING = 10
+
+# One stylesheet for the whole toast so Qt parses it once per toast, not per widget
+_TOAST_QSS = """
+    QWidget {
+        background-color: #444;
+        border-radius: 8px;
+    }
+    QLabel {
+        color: white;
+    }
+"""
+
+# QFont needs a running QGuiApplication, so it is built on first use rather than at import
+_toast_font: QFont | None = None
+_toast_metrics: QFontMetrics | None = None
+
+# Icon loads in flight; keeps each task's signals object alive until it reports back
+_PENDING_ICON_LOADS = set()
+
+
+def _toast_icon_key(icon_path):
+    return f"toast-icon::{icon_path}::{TOAST_ICON_SIZE}"
+
+
+def _cached_toast_icon(icon_path):
+    """Return the scaled toast icon from Qt's pixmap cache, or None on a miss."""
+    pixmap = QPixmap()
+    if QPixmapCache.find(_toast_icon_key(icon_path), pixmap):
+        return pixmap
+    return None
+
+
+class _IconLoadSignals(QObject):
+    loaded = Signal(QImage)
+
+
+class _IconLoadTask(QRunnable):
+    """Decode and scale a toast icon on a pool thread; QImage, unlike QPixmap, is safe off the GUI thread."""
+
+    def __init__(self, icon_path):
+        super().__init__()
+        self.icon_path = icon_path
+        self.signals = _IconLoadSignals()
+
+    def run(self):
+        image = QImage(self.icon_path)
+        if not image.isNull():
+            image = image.scaled(TOAST_ICON_SIZE, TOAST_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.loaded.emit(image)
+
+
+def _load_toast_icon_async(icon_path, icon_label):
+    """Fill ``icon_label`` once the icon has been decoded, and cache the result."""
+    task = _IconLoadTask(icon_path)
+
+    def on_loaded(image):
+        _PENDING_ICON_LOADS.discard(task)
+        pixmap = None
+        if not image.isNull():
+            # Only the cheap QImage -> QPixmap conversion happens on the GUI thread
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(_toast_icon_key(icon_path), pixmap)
+        try:
+            if icon_label.property("iconPath") != icon_path:
+                return  # The pooled toast has since moved on to another icon
+            if pixmap is None:
+                icon_label.hide()
+            else:
+                icon_label.setPixmap(pixmap)
+        except RuntimeError:
+            pass  # The toast was already deleted
+
+    task.signals.loaded.connect(on_loaded, Qt.QueuedConnection)
+    _PENDING_ICON_LOADS.add(task)
+    QThreadPool.globalInstance().start(task)
+
+
+def _get_toast_font():
+    global _toast_font, _toast_metrics
+    if _toast_font is None:
+        # The size lives here rather than in _TOAST_QSS so the cached metrics
+        # match what the label actually renders
+        _toast_font = QFont("Segoe UI", 12)
+        _toast_metrics = QFontMetrics(_toast_font)
+    return _toast_font
+
+
+def _get_toast(parent):
+    """Build the parent's toast once; later calls only re-text and restart it."""
+    toast = getattr(parent, "_toast_widget", None)
+    if toast is not None:
+        return toast
+
+    # A frameless top-level lets the compositor blend windowOpacity, instead of
+    # re-rasterising the toast through a QGraphicsOpacityEffect every frame
+    toast = QWidget(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+    toast.setAttribute(Qt.WA_TranslucentBackground)
+    layout = QHBoxLayout(toast)
+    layout.setContentsMargins(_TOAST_PADDING_X, _TOAST_PADDING_Y, _TOAST_PADDING_X, _TOAST_PADDING_Y)
+    layout.setSpacing(_TOAST_SPACING)
+
+    icon_label = QLabel()
+    icon_label.setFixedSize(TOAST_ICON_SIZE, TOAST_ICON_SIZE)
+    icon_label.hide()
+    layout.addWidget(icon_label)
+
+    text_label = QLabel()
+    text_label.setFont(_get_toast_font())
+    layout.addWidget(text_label)
+
+    toast.setStyleSheet(_TOAST_QSS)
+    toast.hide()
+    toast.setWindowOpacity(0)
+
+    # No start values: each run picks up from the current opacity, so a toast
+    # re-shown mid-fade continues smoothly instead of jumping
+    fade_in = QPropertyAnimation(toast, b"windowOpacity", toast)
+    fade_in.setDuration(400)
+    fade_in.setEndValue(1)
+    fade_in.setEasingCurve(QEasingCurve.InOutQuad)
+
+    fade_out = QPropertyAnimation(toast, b"windowOpacity", toast)
+    fade_out.setDuration(600)
+    fade_out.setEndValue(0)
+    fade_out.setEasingCurve(QEasingCurve.InOutQuad)
+    fade_out.finished.connect(toast.hide)
+
+    hide_timer = QTimer(toast)
+    hide_timer.setSingleShot(True)
+    # Pin to a coarse timer: short toasts would otherwise get a PreciseTimer,
+    # which raises the system timer resolution on Windows
+    hide_timer.setTimerType(Qt.CoarseTimer)
+    hide_timer.timeout.connect(fade_out.start)
+
+    parent._toast_widget = toast
+    parent._toast_icon_label = icon_label
+    parent._toast_text_label = text_label
+    parent._toast_fade_in = fade_in
+    parent._toast_fade_out = fade_out
+    parent._toast_timer = hide_timer
+    return toast
+
 
 def show_toast(parent, message: str, duration=3000, icon_path=None):
     """Show a temporary toast message over the parent window with optional icon."""
-    toast = QWidget(parent)
-    layout = QHBoxLayout()
-    layout.setContentsMargins(12, 10, 12, 10)
-    layout.setSpacing(10)
+    toast = _get_toast(parent)
+    parent._toast_timer.stop()
+    parent._toast_fade_out.stop()
+    parent._toast_fade_in.stop()
 
+    icon_label = parent._toast_icon_label
+    icon_label.setProperty("iconPath", icon_path)
     if icon_path:
-        icon_label = QLabel()
-        pixmap = QPixmap(icon_path)
-        if not pixmap.isNull():
-            icon_label.setPixmap(pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            layout.addWidget(icon_label)
-
-    text_label = QLabel(message)
-    text_label.setStyleSheet("color: white; font-size: 12pt;")
-    text_label.setFont(QFont("Segoe UI", 10))
-    layout.addWidget(text_label)
+        pixmap = _cached_toast_icon(icon_path)
+        if pixmap is not None:
+            icon_label.setPixmap(pixmap)
+        else:
+            icon_label.clear()
+            _load_toast_icon_async(icon_path, icon_label)
+        icon_label.show()
+    else:
+        icon_label.hide()
 
-    toast.setLayout(layout)
-    toast.setStyleSheet("""
-        QWidget {
-            background-color: #444;
-            border-radius: 8px;
-        }
-    """)
-
-    toast.adjustSize()
-    width = toast.width()
-    height = toast.height()
-    parent_center_x = parent.geometry().center().x()
-    toast.move(parent_center_x - width // 2, parent.height() - height - 80)
-
-    opacity = QGraphicsOpacityEffect()
-    toast.setGraphicsEffect(opacity)
-    animation = QPropertyAnimation(opacity, b"opacity")
-    animation.setDuration(400)
-    animation.setStartValue(0)
-    animation.setEndValue(1)
-    animation.setEasingCurve(QEasingCurve.InOutQuad)
-    animation.start()
+    parent._toast_text_label.setText(message)
+
+    # Size straight from the cached font metrics instead of adjustSize(), which
+    # walks the layout's size hints and re-queries the stylesheet
+    text_size = _toast_metrics.size(0, message)
+    width = text_size.width() + 2 * _TOAST_PADDING_X
+    height = text_size.height()
+    if icon_path:
+        width += TOAST_ICON_SIZE + _TOAST_SPACING
+        height = max(height, TOAST_ICON_SIZE)
+    height += 2 * _TOAST_PADDING_Y
+    toast.resize(width, height)
+    # The toast is its own window now, so place it in global coordinates
+    toast.move(parent.mapToGlobal(QPoint((parent.width() - width) // 2, parent.height() - height - 80)))
 
     toast.show()
-    QTimer.singleShot(duration, toast.deleteLater)
-
-    def fade_out():
-        fade = QPropertyAnimation(opacity, b"opacity")
-        fade.setDuration(600)
-        fade.setStartValue(1)
-        fade.setEndValue(0)
-        fade.setEasingCurve(QEasingCurve.InOutQuad)
-        fade.finished.connect(toast.hide)
-        fade.start()
-
-    QTimer.singleShot(duration, fade_out)
+    toast.raise_()
+    parent._toast_fade_in.start()
+    parent._toast_timer.start(duration)
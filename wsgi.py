@@ -1,15 +1,50 @@
 import os
+import sys
+import logging
 from flask_server_qt import FlaskServer
 from stripe_service_qt import StripeService
+from bidder_manager_qt import BidderManager
+from config_qt import DEFAULT_DATA_DIR
+
+# Read the environment once; the port is only parsed when actually set
+_PORT = int(_port) if (_port := os.environ.get("PORT")) else 10000
+_API_TOKEN = os.environ.get("API_TOKEN") or "test_token"
+_SECRET_KEY = os.environ.get("SECRET_KEY") or "dev_secret"
+# Required: a misconfigured deployment fails here at startup rather than on the
+# first Stripe request, even though the service itself is built lazily
+_STRIPE_SECRET_KEY = os.environ["STRIPE_SECRET_KEY"]
+_STRIPE_WEBHOOK_SECRET = os.environ["STRIPE_WEBHOOK_SECRET"]
+
+# A dedicated logger rather than basicConfig: FlaskServer configures the root
+# logger itself, and its format expects a request_id these records don't carry
+_log = logging.getLogger("swiftsale.wsgi")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log.addHandler(_handler)
+_log.setLevel(logging.INFO)
+_log.propagate = False
+
+
+def _make_stripe_service():
+    """Build the StripeService and its database manager on first use."""
+    bidder_manager = BidderManager(os.path.join(DEFAULT_DATA_DIR, "bidders_qt.db"),
+                                   os.path.join(DEFAULT_DATA_DIR, "subscriptions_qt.db"))
+    return StripeService(
+        stripe_secret_key=_STRIPE_SECRET_KEY,
+        webhook_secret=_STRIPE_WEBHOOK_SECRET,
+        db_manager=bidder_manager,
+        api_token=_API_TOKEN
+    )
+
 
 server = FlaskServer(
-    port=int(os.getenv("PORT", 10000)),
-    stripe_service=StripeService(),
-    api_token=os.getenv("API_TOKEN", "test_token"),
+    port=_PORT,
+    stripe_service=_make_stripe_service,  # constructed lazily on first use
+    api_token=_API_TOKEN,
     latest_bin_assignment_callback=None,
-    secret_key=os.getenv("SECRET_KEY", "dev_secret"),
-    log_info=print,
-    log_error=print
+    secret_key=_SECRET_KEY,
+    log_info=_log.info,
+    log_error=_log.error
 )
 
 app = server.app